@@ -0,0 +1,255 @@
+#######################################################
+##### BENCHMARKS FOR THE BINARY SEARCH TREE MAPS #####
+#######################################################
+## Run from the repository root with:
+##     python -m Code.Benchmarks.bst_benchmarks
+## Timings are wall-clock seconds (best of a few repeats).
+
+import random
+import tracemalloc
+from itertools import accumulate
+from timeit import repeat
+
+from Code.Trees.binary_search_tree_ajz import BSTMap
+from Code.Trees.avl_tree_map import AVLTreeMap
+from Code.Trees.red_black_tree_map import RedBlackTreeMap
+from Code.Trees.sorted_chunk_map import SortedChunkMap
+from Code.Trees.skip_list_map import SkipListMap
+
+
+def _best_time(func, n_repeat=3):
+    '''
+        Return the best wall-clock time
+        of n_repeat calls of func().
+    '''
+    return min(repeat(func, number=1, repeat=n_repeat))
+
+def _zipf_keys(n_ops, n_keys, s, rng):
+    '''
+        Return n_ops keys drawn from range(n_keys)
+        with a Zipf distribution of exponent s.
+    '''
+    cum_weights = list(accumulate(1.0/(i+1)**s for i in range(n_keys)))
+    return rng.choices(range(n_keys), cum_weights=cum_weights, k=n_ops)
+
+def _workload(kind, n, rng):
+    '''
+        Return a list of (op, key) pairs, where op is
+        "set" or "del", mixing about 70% insertions and
+        30% deletions of previously inserted keys.
+        kind is "sorted", "random" or "zipf".
+    '''
+    if kind == "sorted":
+        keys = list(range(n))
+    elif kind == "random":
+        keys = [rng.randrange(10*n) for _ in range(n)]
+    elif kind == "zipf":
+        keys = _zipf_keys(n, n, 1.1, rng)
+    else:
+        raise ValueError(f"Unknown workload {kind}")
+
+    ops = []
+    inserted = []
+    for k in keys:
+        ops.append(("set", k))
+        inserted.append(k)
+        if rng.random()<0.3:
+            ops.append(("del", inserted[rng.randrange(len(inserted))]))
+    return ops
+
+def _run(map_class, ops):
+    '''
+        Apply the (op, key) pairs of ops to a new
+        map of class map_class.
+    '''
+    M = map_class()
+    for op, k in ops:
+        if op == "set":
+            M[k] = k
+        else:
+            try:
+                del M[k]
+            except ValueError:
+                pass
+    return M
+
+def _counting_class(map_class):
+    '''
+        Return a subclass of map_class counting
+        its calls to _rotate().
+    '''
+    def _rotate(self, p):
+        type(self).rotations += 1
+        map_class._rotate(self, p)
+    return type(map_class.__name__, (map_class,), {"_rotate": _rotate, "rotations": 0})
+
+def bench_balanced_maps(n=2000, kinds=("sorted", "random", "zipf"), seed=0):
+    '''
+        Compare BSTMap, AVLTreeMap and RedBlackTreeMap
+        on insert/delete mixes with sorted, random and
+        Zipfian keys. Print time and rotations per update.
+        (The unbalanced BSTMap is O(n^2) on sorted keys)
+    '''
+    rng = random.Random(seed)
+    print(f"{'workload':>8} {'map':>16} {'time':>9} {'rotations/update':>17}")
+    for kind in kinds:
+        ops = _workload(kind, n, rng)
+        for map_class in (BSTMap, AVLTreeMap, RedBlackTreeMap):
+            counting = _counting_class(map_class)
+            t = _best_time(lambda: _run(map_class, ops))
+            _run(counting, ops)
+            rot = counting.rotations/len(ops)
+            print(f"{kind:>8} {map_class.__name__:>16} {t:>8.3f}s {rot:>17.3f}")
+
+def _position_search(M, k):
+    '''
+        Reference Position-based search for key k,
+        as done before the node-level cursor layer.
+    '''
+    p = M.root()
+    while True:
+        if k<p.key() and M.left(p) is not None:
+            p = M.left(p)
+        elif k>p.key() and M.right(p) is not None:
+            p = M.right(p)
+        else:
+            return p
+
+def _position_keys(M):
+    '''
+        Reference Position-based in-order walk,
+        as done before the node-level cursor layer.
+    '''
+    keys = []
+    p = M.root()
+    while M.left(p) is not None:
+        p = M.left(p)
+    while p is not None:
+        keys.append(p.key())
+        if M.right(p) is not None:
+            p = M.right(p)
+            while M.left(p) is not None:
+                p = M.left(p)
+        else:
+            parent = M.parent(p)
+            while parent is not None and p == M.right(parent):
+                p, parent = parent, M.parent(parent)
+            p = parent
+    return keys
+
+def bench_cursor(n=50000, n_lookups=50000, seed=0):
+    '''
+        Compare Position-based and node-level
+        lookups and full iteration on an AVLTreeMap
+        with n random keys.
+    '''
+    rng = random.Random(seed)
+    M = AVLTreeMap()
+    keys = rng.sample(range(10*n), n)
+    for k in keys:
+        M[k] = k
+    queries = [rng.choice(keys) for _ in range(n_lookups)]
+
+    t_pos_get = _best_time(lambda: [_position_search(M, k).value() for k in queries])
+    t_node_get = _best_time(lambda: [M[k] for k in queries])
+    t_pos_iter = _best_time(lambda: _position_keys(M))
+    t_node_iter = _best_time(lambda: list(M))
+    print(f"AVLTreeMap with n={n}:")
+    print(f"{'__getitem__':>12} positions {t_pos_get:.3f}s, nodes {t_node_get:.3f}s (x{t_pos_get/t_node_get:.1f})")
+    print(f"{'iteration':>12} positions {t_pos_iter:.3f}s, nodes {t_node_iter:.3f}s (x{t_pos_iter/t_node_iter:.1f})")
+
+def bench_frozen(n=50000, n_lookups=50000, seed=0):
+    '''
+        Compare an AVLTreeMap with n random keys
+        and its frozen Eytzinger-layout copy on
+        lookups, find_ge() and full iteration.
+    '''
+    rng = random.Random(seed)
+    keys = sorted(rng.sample(range(10*n), n))
+    M = AVLTreeMap.from_sorted((k, k) for k in keys)
+    F = M.freeze()
+    F_array = M.freeze(typecode='q')
+    queries = [rng.choice(keys) for _ in range(n_lookups)]
+    bounds = [rng.randrange(10*n) for _ in range(n_lookups)]
+
+    t_build = _best_time(lambda: M.freeze())
+    print(f"AVLTreeMap with n={n} (freeze in {t_build:.3f}s):")
+    print(f"{'':>12} {'linked':>9} {'frozen':>9} {'frozen q':>9}")
+    for name, func in (("__getitem__", lambda T: [T[k] for k in queries]),
+                       ("find_ge", lambda T: [T.find_ge(k) for k in bounds]),
+                       ("iteration", lambda T: list(T))):
+        times = [_best_time(lambda: func(T)) for T in (M, F, F_array)]
+        print(f"{name:>12} {times[0]:>8.3f}s {times[1]:>8.3f}s {times[2]:>8.3f}s")
+
+def _bytes_per_entry(build, n):
+    '''
+        Return the number of bytes allocated
+        per entry by build(), which must return
+        a map with n entries.
+    '''
+    tracemalloc.start()
+    M = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size/n
+
+def bench_chunked(n=50000, n_lookups=50000, seed=0):
+    '''
+        Compare AVLTreeMap and SortedChunkMap with n
+        random keys: memory overhead per entry (keys
+        and values excluded), insertion of the keys in
+        random order, lookups and full iteration.
+    '''
+    rng = random.Random(seed)
+    keys = rng.sample(range(10*n), n)
+    queries = [rng.choice(keys) for _ in range(n_lookups)]
+
+    def build(map_class):
+        M = map_class()
+        for k in keys:
+            M[k] = k
+        return M
+
+    print(f"Maps with n={n} random keys:")
+    print(f"{'map':>16} {'bytes/entry':>12} {'insert':>9} {'lookup':>9} {'iteration':>10}")
+    for map_class in (AVLTreeMap, SortedChunkMap):
+        mem = _bytes_per_entry(lambda: build(map_class), n)
+        t_insert = _best_time(lambda: build(map_class))
+        M = build(map_class)
+        t_get = _best_time(lambda: [M[k] for k in queries])
+        t_iter = _best_time(lambda: list(M))
+        print(f"{map_class.__name__:>16} {mem:>12.1f} {t_insert:>8.3f}s {t_get:>8.3f}s {t_iter:>9.4f}s")
+
+def bench_skip_list(n=2000, kinds=("sorted", "random", "zipf"), n_bulk=50000, seed=0):
+    '''
+        Compare BSTMap, AVLTreeMap and SkipListMap on
+        the insert/delete mixes of bench_balanced_maps(),
+        then compare bulk building from sorted items
+        and range scans on n_bulk keys.
+    '''
+    rng = random.Random(seed)
+    map_classes = (BSTMap, AVLTreeMap, SkipListMap)
+    print(f"{'workload':>8} {'map':>16} {'time':>9}")
+    for kind in kinds:
+        ops = _workload(kind, n, rng)
+        for map_class in map_classes:
+            t = _best_time(lambda: _run(map_class, ops))
+            print(f"{kind:>8} {map_class.__name__:>16} {t:>8.3f}s")
+
+    items = [(k, k) for k in range(0, 10*n_bulk, 10)]
+    ranges = [(lo, lo+1000) for lo in (rng.randrange(10*n_bulk) for _ in range(1000))]
+    print(f"{n_bulk} sorted keys:")
+    print(f"{'map':>16} {'from_sorted':>12} {'ranges':>9}")
+    for map_class in map_classes:
+        t_build = _best_time(lambda: map_class.from_sorted(items))
+        M = map_class.from_sorted(items)
+        t_ranges = _best_time(lambda: [list(M.find_range(lo, hi)) for lo, hi in ranges])
+        print(f"{map_class.__name__:>16} {t_build:>11.3f}s {t_ranges:>8.3f}s")
+
+
+if __name__ == "__main__":
+    bench_balanced_maps()
+    bench_cursor()
+    bench_frozen()
+    bench_chunked()
+    bench_skip_list()
@@ -0,0 +1,112 @@
+##########################################################
+##### BENCHMARKS FOR THE HEAP PRIORITY QUEUE CLASSES #####
+##########################################################
+## Run from the repository root with:
+##     python -m Code.Benchmarks.heap_benchmarks
+## Timings are wall-clock seconds (best of a few repeats).
+
+import random
+from timeit import repeat
+
+from Code.Trees.heap_priority_queue import HeapPriorityQ
+from Code.Trees.radix_heap_priority_queue import RadixHeapPriorityQ
+
+
+def _best_time(func, n_repeat=3):
+    '''
+        Return the best wall-clock time
+        of n_repeat calls of func().
+    '''
+    return min(repeat(func, number=1, repeat=n_repeat))
+
+def bench_arity(sizes=(10**3, 10**4, 10**5), arities=(2, 4, 8), seed=0):
+    '''
+        Compare push and pop throughput of
+        HeapPriorityQ for several heap arities.
+        For each size n, time n calls to add()
+        followed by n calls to remove_min(), and
+        print operations per second. The arity
+        with the highest throughput is marked,
+        showing the crossover points.
+    '''
+    rng = random.Random(seed)
+    print(f"{'n':>8} {'arity':>6} {'push ops/s':>12} {'pop ops/s':>12}")
+    for n in sizes:
+        keys = [rng.random() for _ in range(n)]
+        results = {}
+        for d in arities:
+            def push():
+                H = HeapPriorityQ(arity=d)
+                for k in keys:
+                    H.add(k, None)
+                return H
+
+            def pop():
+                H = HeapPriorityQ(((k, None) for k in keys), arity=d)
+                for _ in range(n):
+                    H.remove_min()
+
+            t_push = _best_time(push)
+            # The O(n) build is included in pop timings, but is small
+            t_pop = _best_time(pop)
+            results[d] = (n/t_push, n/t_pop)
+
+        best_push = max(results, key=lambda d: results[d][0])
+        best_pop = max(results, key=lambda d: results[d][1])
+        for d in arities:
+            push_rate, pop_rate = results[d]
+            push_mark = "*" if d == best_push else " "
+            pop_mark = "*" if d == best_pop else " "
+            print(f"{n:>8} {d:>6} {push_rate:>11.0f}{push_mark} {pop_rate:>11.0f}{pop_mark}")
+
+def _random_graph(n, m, max_weight, rng):
+    '''
+        Return adjacency lists of a random directed
+        graph with n vertices and about m edges,
+        with integer weights in [1, max_weight].
+    '''
+    adj = [[] for _ in range(n)]
+    for u in range(n):
+        # Ring edge, so that all vertices are reachable
+        adj[u].append(((u+1)%n, rng.randint(1, max_weight)))
+    for _ in range(m-n):
+        adj[rng.randrange(n)].append((rng.randrange(n), rng.randint(1, max_weight)))
+    return adj
+
+def _dijkstra(adj, source, pq_class):
+    '''
+        Dijkstra's algorithm with lazy deletion,
+        using a priority queue of class pq_class.
+        Return the list of distances from source.
+    '''
+    dist = [None]*len(adj)
+    Q = pq_class()
+    Q.add(0, source)
+    while not Q.is_empty():
+        d, u = Q.remove_min()
+        if dist[u] is not None:
+            continue
+        dist[u] = d
+        for w, weight in adj[u]:
+            if dist[w] is None:
+                Q.add(d+weight, w)
+    return dist
+
+def bench_dijkstra(n=20000, m=100000, max_weight=1000, seed=0):
+    '''
+        Compare HeapPriorityQ and RadixHeapPriorityQ
+        on a Dijkstra shortest-path trace over a
+        random graph with integer edge weights.
+    '''
+    adj = _random_graph(n, m, max_weight, random.Random(seed))
+    assert _dijkstra(adj, 0, HeapPriorityQ) == _dijkstra(adj, 0, RadixHeapPriorityQ)
+    print(f"Dijkstra on n={n}, m={m}:")
+    t_heap = _best_time(lambda: _dijkstra(adj, 0, HeapPriorityQ))
+    t_radix = _best_time(lambda: _dijkstra(adj, 0, RadixHeapPriorityQ))
+    print(f"{'HeapPriorityQ':>20} {t_heap:.3f}s")
+    print(f"{'RadixHeapPriorityQ':>20} {t_radix:.3f}s (x{t_heap/t_radix:.1f})")
+
+
+if __name__ == "__main__":
+    bench_arity()
+    bench_dijkstra()
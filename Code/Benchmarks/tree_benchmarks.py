@@ -0,0 +1,83 @@
+##############################################
+##### BENCHMARKS FOR THE TREE TRAVERSALS #####
+##############################################
+## Run from the repository root with:
+##     python -m Code.Benchmarks.tree_benchmarks
+## Timings are wall-clock seconds (best of a few repeats).
+
+import random
+from timeit import repeat
+
+from Code.Trees.linked_binary_tree import LinkedBinaryTree
+from Code.Trees.linked_queue import LinkedQueue
+
+
+def _best_time(func, n_repeat=3):
+    '''
+        Return the best wall-clock time
+        of n_repeat calls of func().
+    '''
+    return min(repeat(func, number=1, repeat=n_repeat))
+
+def _random_tree(n, rng):
+    '''
+        Return a LinkedBinaryTree with n nodes,
+        each new node being added as a missing
+        child of a random existing node.
+    '''
+    T = LinkedBinaryTree()
+    open_slots = [(T._add_root(0), True), (T.root(), False)]
+    for i in range(1, n):
+        j = rng.randrange(len(open_slots))
+        open_slots[j], open_slots[-1] = open_slots[-1], open_slots[j]
+        p, left = open_slots.pop()
+        c = T._add_left(p, i) if left else T._add_right(p, i)
+        open_slots.append((c, True))
+        open_slots.append((c, False))
+    return T
+
+def _per_node_breadthfirst(T):
+    '''
+        Reference per-node breadth-first traversal
+        with one LinkedQueue enqueue/dequeue per
+        position, as Tree.breadthfirst() was written.
+    '''
+    if not T.is_empty():
+        fringe = LinkedQueue()
+        fringe.enqueue(T.root())
+        while not fringe.is_empty():
+            p = fringe.dequeue()
+            yield p
+            for c in T.children(p):
+                fringe.enqueue(c)
+
+def _per_node_levels(T):
+    '''
+        Reference level-wise grouping on top of
+        the per-node traversal, using depth().
+    '''
+    levels = {}
+    for p in _per_node_breadthfirst(T):
+        levels.setdefault(T.depth(p), []).append(p)
+    return [levels[d] for d in sorted(levels)]
+
+def bench_breadthfirst(n=100000, seed=0):
+    '''
+        Compare the per-node LinkedQueue traversal
+        with the deque-based breadthfirst() and the
+        level-batched breadthfirst_levels(), on a
+        random binary tree with n nodes.
+    '''
+    rng = random.Random(seed)
+    T = _random_tree(n, rng)
+    t_node = _best_time(lambda: list(_per_node_breadthfirst(T)))
+    t_deque = _best_time(lambda: list(T.breadthfirst()))
+    t_node_levels = _best_time(lambda: _per_node_levels(T))
+    t_levels = _best_time(lambda: list(T.breadthfirst_levels()))
+    print(f"Random binary tree with n={n} (height {T.height()}):")
+    print(f"{'positions':>10} per-node {t_node:.3f}s, deque {t_deque:.3f}s (x{t_node/t_deque:.1f})")
+    print(f"{'levels':>10} per-node {t_node_levels:.3f}s, batched {t_levels:.3f}s (x{t_node_levels/t_levels:.1f})")
+
+
+if __name__ == "__main__":
+    bench_breadthfirst()
@@ -0,0 +1,114 @@
+from .heap_priority_queue import HeapPriorityQ
+
+# Based on: https://github.com/mjwestcott/Goodrich/blob/master/ch09/adaptable_heap_priority_queue.py
+class AdaptableHeapPriorityQ(HeapPriorityQ):
+    '''
+        Implementation of an adaptable priority
+        queue as an array-based heap.
+        add() returns a locator, which can be
+        passed to update() and remove() in order
+        to modify or delete an arbitrary item
+        in O(log n) time.
+        The constructor and from_pairs() load their
+        contents without returning any locator: to
+        get the locators of a batch of pairs, build
+        an empty queue and call extend(), which
+        returns them in the order of the pairs.
+    '''
+    #---------- Nested Locator class ----------
+    class Locator(HeapPriorityQ._Item):
+        '''
+            Token for locating an entry of the
+            priority queue. Keeps track of the
+            index of the item in the heap array.
+        '''
+        __slots__ = '_index'
+
+        def __init__(self, k, v, j):
+            super().__init__(k,v)
+            self._index = j
+
+    #---------- Private methods ----------
+    def _swap(self, i, j):
+        '''
+            Interchange items in nodes at positions
+            i and j, and update their locators.
+        '''
+        super()._swap(i,j)
+        self._data[i]._index = i
+        self._data[j]._index = j
+
+    def _bubble(self, j):
+        '''
+            Restore the heap-order property at
+            position j, by bubbling up or down.
+        '''
+        if j>0 and self._data[j]<self._data[self._parent(j)]:
+            self._bubble_up(j)
+        else:
+            self._bubble_down(j)
+
+    def _validate_locator(self, loc):
+        '''
+            Return index of locator loc.
+            Raises ValueError if loc is not a valid
+            locator of the current priority queue.
+        '''
+        if not isinstance(loc, self.Locator):
+            raise TypeError("loc must be a Locator object")
+        j = loc._index
+        if not (0<=j<len(self._data) and self._data[j] is loc):
+            raise ValueError("Invalid locator")
+        return j
+
+    #---------- Public methods ----------
+    def add(self, k, v):
+        '''
+            Add key-value item (k,v) to the priority queue,
+            and return a locator for the new entry.
+        '''
+        token = self.Locator(k, v, len(self._data))
+        self._data.append(token)
+        self._bubble_up(len(self._data)-1)
+        return token
+
+    def extend(self, contents):
+        '''
+            Add all (key, value) pairs of the
+            iterable contents to the priority queue,
+            and return the list of their locators.
+        '''
+        n = len(self._data)
+        tokens = [self.Locator(k, v, n+j) for j, (k,v) in enumerate(contents)]
+        self._extend_items(tokens)
+        return tokens
+
+    def update(self, loc, k, v):
+        '''
+            Update the key and value of the entry
+            identified by locator loc.
+            Raises ValueError if loc is invalid.
+        '''
+        j = self._validate_locator(loc)
+        loc._key = k
+        loc._value = v
+        self._bubble(j)
+
+    def remove(self, loc):
+        '''
+            Remove and return the (k,v) pair
+            identified by locator loc.
+            Raises ValueError if loc is invalid.
+        '''
+        j = self._validate_locator(loc)
+
+        # Item at last position: simply pop it
+        if j == len(self._data)-1:
+            self._data.pop()
+        # Otherwise swap with last item, then restore heap-order
+        else:
+            self._swap(j, len(self._data)-1)
+            self._data.pop()
+            self._bubble(j)
+
+        return (loc._key, loc._value)
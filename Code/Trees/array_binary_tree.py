@@ -0,0 +1,318 @@
+from array import array
+from .binary_tree import BinaryTree
+
+class ArrayBinaryTree(BinaryTree):
+    '''
+        Binary tree with the same API as
+        LinkedBinaryTree, storing its nodes in
+        an index pool instead of _Node objects:
+        - node i has element _element[i], and
+          parent, left and right indices _parent[i],
+          _left[i] and _right[i] (-1 for None),
+          stored in array('l') parallel arrays,
+        - deleted slots are chained in a free list
+          (through _left) and reused by later insertions,
+        - a Position is an integer handle (slot index
+          and generation); the generation of a slot is
+          incremented when it is deleted, which
+          invalidates the positions of the slot.
+        Hence the tree costs a few machine words per
+        node, with no per-node Python object.
+    '''
+    #---------- Nested Position class ----------
+    class Position(BinaryTree.Position):
+        '''
+            Lightweight handle to a slot of the tree.
+        '''
+        __slots__ = '_container', '_index', '_gen'
+
+        def __init__(self, container, index):
+            '''
+                Constructor should not be invoked by user.
+            '''
+            self._container = container
+            self._index = index
+            self._gen = container._gen[index]
+
+        def element(self):
+            '''
+                Return the element stored at this Position.
+            '''
+            return self._container._element[self._index]
+
+        def __eq__(self, other):
+            return (type(other) is type(self) and other._container is self._container
+                    and other._index == self._index and other._gen == self._gen)
+
+    #---------- Constructor ----------
+    def __init__(self, typecode='l'):
+        '''
+            Create an initially empty binary tree.
+            typecode is the array type of the
+            link arrays (e.g. 'l' or 'q').
+        '''
+        self._typecode = typecode
+        self._element = []
+        self._parent = array(typecode)
+        self._left = array(typecode)
+        self._right = array(typecode)
+        self._gen = array(typecode)
+        self._free = -1         # First free slot (-1 if none)
+        self._root = -1
+        self._size = 0
+
+    #---------- Private slot methods ----------
+    def _validate(self, p):
+        '''
+            Return slot index of position p.
+        '''
+        if not isinstance(p, self.Position):
+            raise TypeError('p must be proper Position type')
+        if p._container is not self:
+            raise ValueError('p does not belong to this container')
+        if self._gen[p._index] != p._gen:      # slot deleted since p was made
+            raise ValueError('p is no longer valid')
+        return p._index
+
+    def _make_position(self, i):
+        '''
+            Return Position of slot i (None if i is -1).
+        '''
+        return self.Position(self, i) if i != -1 else None
+
+    def _new_slot(self, e, parent):
+        '''
+            Return index of a slot storing element e,
+            with the given parent and no child.
+            Reuses a free slot if there is one.
+        '''
+        i = self._free
+        if i != -1:
+            self._free = self._left[i]
+            self._element[i] = e
+            self._parent[i] = parent
+            self._left[i] = -1
+            self._right[i] = -1
+        else:
+            i = len(self._element)
+            self._element.append(e)
+            self._parent.append(parent)
+            self._left.append(-1)
+            self._right.append(-1)
+            self._gen.append(0)
+        self._size += 1
+        return i
+
+    def _free_slot(self, i):
+        '''
+            Put slot i on the free list,
+            invalidating its positions.
+        '''
+        self._element[i] = None
+        self._parent[i] = -1
+        self._right[i] = -1
+        self._left[i] = self._free
+        self._free = i
+        self._gen[i] += 1
+
+    #---------- Node-level traversal hooks ----------
+    # Slot indices are the nodes walked by depth() and height()
+    def _to_node(self, p):
+        return self._validate(p)
+
+    def _node_parent(self, i):
+        parent = self._parent[i]
+        return parent if parent != -1 else None
+
+    def _node_children(self, i):
+        return [c for c in (self._left[i], self._right[i]) if c != -1]
+
+    #---------- Public accessors ----------
+    def __len__(self):
+        '''
+            Return the total number of elements in the tree.
+        '''
+        return self._size
+
+    def root(self):
+        '''
+            Return the root Position of the tree
+            (or None if tree is empty).
+        '''
+        return self._make_position(self._root)
+
+    def parent(self, p):
+        '''
+            Return the Position of p's parent
+            (or None if p is root).
+        '''
+        return self._make_position(self._parent[self._validate(p)])
+
+    def left(self, p):
+        '''
+            Return the Position of p's left child
+            (or None if no left child).
+        '''
+        return self._make_position(self._left[self._validate(p)])
+
+    def right(self, p):
+        '''
+            Return the Position of p's right child
+            (or None if no right child).
+        '''
+        return self._make_position(self._right[self._validate(p)])
+
+    def num_children(self, p):
+        '''
+            Return the number of children of Position p.
+        '''
+        i = self._validate(p)
+        return (self._left[i] != -1)+(self._right[i] != -1)
+
+    def children(self, p):
+        '''
+            Generate an iteration of Positions
+            representing p's children.
+        '''
+        i = self._validate(p)
+        for c in (self._left[i], self._right[i]):
+            if c != -1:
+                yield self.Position(self, c)
+
+    #---------- Nonpublic mutators ----------
+    def _add_root(self, e):
+        '''
+            Place element e at the root of an empty
+            tree and return new Position.
+            Raise ValueError if tree nonempty.
+        '''
+        if self._root != -1:
+            raise ValueError('Root exists')
+        self._root = self._new_slot(e, -1)
+        return self._make_position(self._root)
+
+    def _add_left(self, p, e):
+        '''
+            Create a new left child for Position p,
+            storing element e, and return its Position.
+            Raise ValueError if Position p is invalid
+            or p already has a left child.
+        '''
+        i = self._validate(p)
+        if self._left[i] != -1:
+            raise ValueError('Left child exists')
+        c = self._new_slot(e, i)
+        self._left[i] = c
+        return self._make_position(c)
+
+    def _add_right(self, p, e):
+        '''
+            Create a new right child for Position p,
+            storing element e, and return its Position.
+            Raise ValueError if Position p is invalid
+            or p already has a right child.
+        '''
+        i = self._validate(p)
+        if self._right[i] != -1:
+            raise ValueError('Right child exists')
+        c = self._new_slot(e, i)
+        self._right[i] = c
+        return self._make_position(c)
+
+    def _replace(self, p, e):
+        '''
+            Replace the element at position p with e,
+            and return old element.
+        '''
+        i = self._validate(p)
+        old = self._element[i]
+        self._element[i] = e
+        return old
+
+    def _delete(self, p):
+        '''
+            Delete the node at Position p, and replace
+            it with its child, if any.
+            Return the element that had been stored at p.
+            Raise ValueError if Position p is invalid
+            or p has two children.
+        '''
+        i = self._validate(p)
+        left, right = self._left[i], self._right[i]
+        if left != -1 and right != -1:
+            raise ValueError('Position has two children')
+        child = left if left != -1 else right      # might be -1
+        parent = self._parent[i]
+        if child != -1:
+            self._parent[child] = parent
+        if i == self._root:
+            self._root = child
+        elif self._left[parent] == i:
+            self._left[parent] = child
+        else:
+            self._right[parent] = child
+        old = self._element[i]
+        self._size -= 1
+        self._free_slot(i)
+        return old
+
+    def _copy_subtree(self, t, root, parent):
+        '''
+            Copy the subtree of tree t rooted at slot
+            root into new slots of the current tree,
+            below slot parent, and return the new root.
+        '''
+        new_root = self._new_slot(t._element[root], parent)
+        stack = [(root, new_root)]
+        while len(stack)>0:
+            src, dst = stack.pop()
+            if t._left[src] != -1:
+                c = self._new_slot(t._element[t._left[src]], dst)
+                self._left[dst] = c
+                stack.append((t._left[src], c))
+            if t._right[src] != -1:
+                c = self._new_slot(t._element[t._right[src]], dst)
+                self._right[dst] = c
+                stack.append((t._right[src], c))
+        return new_root
+
+    def _clear(self):
+        '''
+            Remove all nodes, invalidating all positions.
+        '''
+        for i in range(len(self._gen)):
+            self._gen[i] += 1
+        # Keep generations, so that old positions stay invalid
+        n = len(self._gen)
+        self._element = [None]*n
+        self._parent = array(self._typecode, [-1])*n
+        self._right = array(self._typecode, [-1])*n
+        self._left = array(self._typecode, range(-1, n-1))
+        self._free = n-1
+        self._root = -1
+        self._size = 0
+
+    def _attach(self, p, t1, t2):
+        '''
+            Attach trees t1 and t2, respectively, as the
+            left and right subtrees of the external
+            Position p. The nodes of t1 and t2 are copied
+            into the pool of the current tree, in
+            O(len(t1)+len(t2)) time.
+            As a side effect, set t1 and t2 to empty.
+            Raise TypeError if trees t1 and t2 do not
+            match type of this tree.
+            Raise ValueError if Position p is invalid
+            or not external.
+        '''
+        i = self._validate(p)
+        if not self.is_leaf(p):
+            raise ValueError('position must be leaf')
+        if not type(self) is type(t1) is type(t2):    # all 3 trees must be same type
+            raise TypeError('Tree types must match')
+        if not t1.is_empty():
+            self._left[i] = self._copy_subtree(t1, t1._root, i)
+            t1._clear()
+        if not t2.is_empty():
+            self._right[i] = self._copy_subtree(t2, t2._root, i)
+            t2._clear()
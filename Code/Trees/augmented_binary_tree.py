@@ -0,0 +1,157 @@
+from .linked_binary_tree import LinkedBinaryTree
+
+class AugmentedBinaryTree(LinkedBinaryTree):
+    '''
+        Linked binary tree in which each node also
+        stores, for its subtree:
+        - its height (0 for a leaf),
+        - its number of nodes,
+        - an aggregate of its elements for a monoid
+          (combine, identity), e.g. (operator.add, 0)
+          for a sum or (max, float('-inf')) for a max.
+        The aggregate of a subtree is
+            combine(combine(A(left), measure(e)), A(right))
+        where e is the element at its root, and A of a
+        missing subtree is identity, so combine only needs
+        to be associative (not commutative).
+        Every mutator updates the nodes on the path to
+        the root, in O(depth) time, so that height(p),
+        subtree_size(p) and aggregate(p) take O(1) time.
+    '''
+    #---------- Nested _Node class ----------
+    class _Node(LinkedBinaryTree._Node):
+        '''
+            Node class with subtree height,
+            size and aggregate attributes.
+        '''
+        __slots__ = '_height', '_size', '_agg'
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            super().__init__(element, parent, left, right)
+            self._height = 0
+            self._size = 1
+            self._agg = None
+
+    #---------- Constructor ----------
+    def __init__(self, combine=None, identity=None, measure=None):
+        '''
+            Create an initially empty binary tree.
+            combine is an associative function of two
+            values with neutral element identity; if it
+            is None, no aggregate is maintained.
+            measure maps an element to the value that
+            is aggregated (the element itself if None).
+        '''
+        super().__init__()
+        self._combine = combine
+        self._identity = identity
+        self._measure = measure
+
+    #---------- Private augmentation methods ----------
+    def _recompute(self, node):
+        '''
+            Recompute height, size and aggregate
+            of node from those of its children.
+        '''
+        left, right = node._left, node._right
+        h, size = -1, 1
+        if left is not None:
+            h = left._height
+            size += left._size
+        if right is not None:
+            h = max(h, right._height)
+            size += right._size
+        node._height = h+1
+        node._size = size
+        if self._combine is not None:
+            combine = self._combine
+            value = node._element if self._measure is None else self._measure(node._element)
+            agg = combine(left._agg, value) if left is not None else value
+            node._agg = combine(agg, right._agg) if right is not None else agg
+
+    def _update_path(self, node):
+        '''
+            Recompute node and all its ancestors.
+        '''
+        while node is not None:
+            self._recompute(node)
+            node = node._parent
+
+    #---------- Nonpublic mutators ----------
+    def _add_root(self, e):
+        p = super()._add_root(e)
+        self._update_path(p._node)
+        return p
+
+    def _add_left(self, p, e):
+        c = super()._add_left(p, e)
+        self._update_path(c._node)
+        return c
+
+    def _add_right(self, p, e):
+        c = super()._add_right(p, e)
+        self._update_path(c._node)
+        return c
+
+    def _replace(self, p, e):
+        old = super()._replace(p, e)
+        self._update_path(p._node)
+        return old
+
+    def _delete(self, p):
+        parent = self._validate(p)._parent
+        old = super()._delete(p)
+        self._update_path(parent)
+        return old
+
+    def _attach(self, p, t1, t2):
+        '''
+            Attach trees t1 and t2 as the left and right
+            subtrees of the external Position p, and
+            update the ancestors of p.
+            Raise ValueError if t1 or t2 maintains a
+            different aggregate than this tree.
+        '''
+        for t in (t1, t2):
+            if isinstance(t, AugmentedBinaryTree) and not t.is_empty() and \
+               (t._combine, t._identity, t._measure) != (self._combine, self._identity, self._measure):
+                raise ValueError('Attached trees must use the same aggregate')
+        super()._attach(p, t1, t2)
+        self._update_path(p._node)
+
+    #---------- Public augmented accessors ----------
+    def height(self, p=None):
+        '''
+            Return the height of the subtree rooted
+            at Position p (the whole tree if p is None),
+            in O(1) time.
+        '''
+        if p is None:
+            p = self.root()
+        return self._validate(p)._height
+
+    def subtree_size(self, p=None):
+        '''
+            Return the number of nodes of the subtree
+            rooted at Position p (the whole tree if p
+            is None), in O(1) time.
+        '''
+        if p is None:
+            return len(self)
+        return self._validate(p)._size
+
+    def aggregate(self, p=None):
+        '''
+            Return the aggregate of the elements of the
+            subtree rooted at Position p (the whole tree
+            if p is None), in O(1) time.
+            Returns identity for an empty tree.
+            Raise ValueError if no aggregate is maintained.
+        '''
+        if self._combine is None:
+            raise ValueError('Tree maintains no aggregate')
+        if p is None:
+            if self._root is None:
+                return self._identity
+            return self._root._agg
+        return self._validate(p)._agg
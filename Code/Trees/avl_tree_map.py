@@ -0,0 +1,195 @@
+from .binary_search_tree_ajz import BSTMap
+
+# Based on: https://github.com/mjwestcott/Goodrich/blob/master/ch11/avl_tree.py
+class AVLTreeMap(BSTMap):
+    '''
+        Implementation of a map as an AVL tree.
+        Each node stores the height of its subtree,
+        and the heights of the two children of a node
+        differ by at most 1. The tree height is thus
+        O(log n), and so is the cost of insertion,
+        search and deletion.
+    '''
+    #---------- Nested _Node class ----------
+    class _Node(BSTMap._Node):
+        '''
+            Node class with a height attribute.
+            (Leaves have height 1)
+        '''
+        __slots__ = '_height'
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            super().__init__(element, parent, left, right)
+            self._height = 0
+
+        def left_height(self):
+            return self._left._height if self._left is not None else 0
+
+        def right_height(self):
+            return self._right._height if self._right is not None else 0
+
+    #---------- Private AVL balancing methods ----------
+    def _recompute_height(self, p):
+        '''
+            Update height of node at position p
+            from the heights of its children.
+        '''
+        p._node._height = 1+max(p._node.left_height(), p._node.right_height())
+
+    def _is_balanced(self, p):
+        '''
+            Return True if the heights of the children
+            of p differ by at most 1.
+        '''
+        return abs(p._node.left_height()-p._node.right_height())<=1
+
+    def _tall_child(self, p, favor_left=False):
+        '''
+            Return child of p with greatest height.
+            Ties are broken to the left if favor_left.
+        '''
+        if p._node.left_height()+(1 if favor_left else 0) > p._node.right_height():
+            return self.left(p)
+        else:
+            return self.right(p)
+
+    def _tall_grandchild(self, p):
+        '''
+            Return tallest grandchild of p, favoring
+            the one aligned with the tallest child.
+        '''
+        child = self._tall_child(p)
+        alignment = (child == self.left(p))
+        return self._tall_child(child, alignment)
+
+    def _rebalance(self, p):
+        '''
+            Walk up from position p, restoring the
+            balance property and updating heights.
+            Stops as soon as a height is unchanged.
+        '''
+        while p is not None:
+            old_height = p._node._height
+            # Trinode restructuring if p is unbalanced
+            if not self._is_balanced(p):
+                p = self._trinode_restructure(self._tall_grandchild(p))
+                self._recompute_height(self.left(p))
+                self._recompute_height(self.right(p))
+            self._recompute_height(p)
+            if p._node._height == old_height:
+                p = None
+            else:
+                p = self.parent(p)
+
+    #---------- Private node-level join methods ----------
+    @staticmethod
+    def _node_height(node):
+        return node._height if node is not None else 0
+
+    def _update_node(self, node):
+        '''
+            Recompute the data stored in node
+            (its height) from its children.
+        '''
+        node._height = 1+max(node.left_height(), node.right_height())
+
+    def _rotate_left_node(self, x):
+        '''
+            Rotate the right child of node x above x,
+            and return it. The parent link of the
+            returned node is left to the caller.
+        '''
+        y = x._right
+        self._relink(x, y._left, False)
+        self._relink(y, x, True)
+        self._update_node(x)
+        self._update_node(y)
+        return y
+
+    def _rotate_right_node(self, x):
+        '''
+            Rotate the left child of node x above x,
+            and return it. The parent link of the
+            returned node is left to the caller.
+        '''
+        y = x._left
+        self._relink(x, y._right, True)
+        self._relink(y, x, False)
+        self._update_node(x)
+        self._update_node(y)
+        return y
+
+    def _join_right(self, left, mid, right):
+        '''
+            AVL join when left is taller than right
+            by more than 1: descend the right spine
+            of left, and rebalance on the way back.
+        '''
+        c = left._right
+        if self._node_height(c)<=self._node_height(right)+1:
+            self._relink(mid, c, True)
+            self._relink(mid, right, False)
+            self._update_node(mid)
+            t = mid
+            if t._height>self._node_height(left._left)+1:
+                t = self._rotate_right_node(mid)
+                self._relink(left, t, False)
+                return self._rotate_left_node(left)
+        else:
+            t = self._join_right(c, mid, right)
+        self._relink(left, t, False)
+        if t._height<=self._node_height(left._left)+1:
+            self._update_node(left)
+            return left
+        return self._rotate_left_node(left)
+
+    def _join_left(self, left, mid, right):
+        '''
+            Mirror image of _join_right(), when right
+            is taller than left by more than 1.
+        '''
+        c = right._left
+        if self._node_height(c)<=self._node_height(left)+1:
+            self._relink(mid, left, True)
+            self._relink(mid, c, False)
+            self._update_node(mid)
+            t = mid
+            if t._height>self._node_height(right._right)+1:
+                t = self._rotate_left_node(mid)
+                self._relink(right, t, True)
+                return self._rotate_right_node(right)
+        else:
+            t = self._join_left(left, mid, c)
+        self._relink(right, t, True)
+        if t._height<=self._node_height(right._right)+1:
+            self._update_node(right)
+            return right
+        return self._rotate_right_node(right)
+
+    def _join_nodes(self, left, mid, right):
+        '''
+            AVL join of detached subtrees left and right
+            with node mid, in O(|h(left)-h(right)|+1) time.
+        '''
+        hl, hr = self._node_height(left), self._node_height(right)
+        if hl>hr+1:
+            root = self._join_right(left, mid, right)
+        elif hr>hl+1:
+            root = self._join_left(left, mid, right)
+        else:
+            self._relink(mid, left, True)
+            self._relink(mid, right, False)
+            self._update_node(mid)
+            root = mid
+        root._parent = None
+        return root
+
+    #---------- Rebalancing hooks ----------
+    def _init_bulk_node(self, node, depth, max_depth):
+        self._update_node(node)
+
+    def _rebalance_insert(self, p):
+        self._rebalance(p)
+
+    def _rebalance_delete(self, p):
+        self._rebalance(p)
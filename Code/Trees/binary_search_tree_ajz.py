@@ -28,7 +28,8 @@ class BSTMap(LinkedBinaryTree, MapBase):
     '''
         Implementation of a map as a
         binary search tree.
-        No rebalancing done in this version.
+        No rebalancing done in this version,
+        see AVLTreeMap for a balanced subclass.
     '''
     #---------- Nested Position class ----------
     class Position(LinkedBinaryTree.Position):
@@ -36,6 +37,16 @@ class BSTMap(LinkedBinaryTree, MapBase):
             Abstract position class for nodes
             of BST
         '''
+        def __init__(self, container, node):
+            '''
+                Constructor should not be invoked by user.
+                Records the epoch of the container, so that
+                split, join and set operations can
+                invalidate all positions of a map at once.
+            '''
+            super().__init__(container, node)
+            self._epoch = container._epoch
+        
         def key(self):
             '''
                 Return key attribute of item contained in current position
@@ -48,6 +59,106 @@ class BSTMap(LinkedBinaryTree, MapBase):
             '''
             return self.element()._value
     
+    # Incremented when the nodes of the map are moved or dropped in bulk
+    _epoch = 0
+    
+    #---------- Private position validation ----------
+    def _validate(self, p):
+        '''
+            Return node of position p. Raises ValueError if
+            p was made before the last split, join or set
+            operation involving the map.
+        '''
+        node = super()._validate(p)
+        if p._epoch != self._epoch:
+            raise ValueError('p is no longer valid')
+        return node
+    
+    #---------- Private node-level cursor methods ----------
+    '''
+        The methods below walk _Node objects directly
+        and iteratively, without validating or creating
+        Position objects. Positions are only created
+        at the boundary of the public API.
+    '''
+    def _search_node(self, node, k):
+        '''
+            Search for key k in subtree rooted
+            at node, and return the node with key k
+            or the last node visited.
+            Assumes node is not None.
+        '''
+        while True:
+            key = node._element._key
+            if k<key:
+                if node._left is None:
+                    return node
+                node = node._left
+            elif k==key:
+                return node
+            else:
+                if node._right is None:
+                    return node
+                node = node._right
+    
+    def _subtree_first_node(self, node):
+        '''
+            Return node with lowest key
+            in subtree rooted at node.
+        '''
+        while node._left is not None:
+            node = node._left
+        return node
+    
+    def _subtree_last_node(self, node):
+        '''
+            Return node with greatest key
+            in subtree rooted at node.
+        '''
+        while node._right is not None:
+            node = node._right
+        return node
+    
+    def _before_node(self, node):
+        '''
+            Return node just before node in
+            BST order (None if node is first).
+        '''
+        if node._left is not None:
+            return self._subtree_last_node(node._left)
+        # Walk upward until ancestor is reached from its right
+        parent = node._parent
+        while parent is not None and node is parent._left:
+            node = parent
+            parent = node._parent
+        return parent
+    
+    def _after_node(self, node):
+        '''
+            Return node just after node in
+            BST order (None if node is last).
+        '''
+        if node._right is not None:
+            return self._subtree_first_node(node._right)
+        # Walk upward until ancestor is reached from its left
+        parent = node._parent
+        while parent is not None and node is parent._right:
+            node = parent
+            parent = node._parent
+        return parent
+    
+    def _find_node(self, k):
+        '''
+            Search for key k from the root, call
+            the access hook on the last node visited,
+            and return this node (None if map is empty).
+        '''
+        if self._root is None:
+            return None
+        node = self._search_node(self._root, k)
+        self._access_node(node)
+        return node
+    
     #---------- Private tree search methods ----------
     def _search_subtree(self, p, k):
         '''
@@ -55,37 +166,27 @@ class BSTMap(LinkedBinaryTree, MapBase):
             rooted at position p.
             Assumes tree is non-empty.
         '''
-        if k<p.key() and self.left(p) is not None:
-            return self._search_subtree(self.left(p), k)
-        elif k==p.key():
-            return p
-        elif k>p.key() and self.right(p) is not None:
-            return self._search_subtree(self.right(p), k)
-        return p
+        return self._make_position(self._search_node(p._node, k))
     
     def _subtree_first_position(self, p):
         '''
             Return position of first item
             in subtree rooted at p.
         '''
-        cur_pos = p
-        while self.left(cur_pos) is not None:
-            cur_pos = self.left(cur_pos)
-        return cur_pos
+        return self._make_position(self._subtree_first_node(p._node))
     
     def _subtree_last_position(self, p):
         '''
             Return position of last item
             in subtree rooted at p.
         '''
-        cur_pos = p
-        while self.right(cur_pos) is not None:
-            cur_pos = self.right(cur_pos)
-        return cur_pos
+        return self._make_position(self._subtree_last_node(p._node))
             
     #---------- Private tree restructuring methods ----------
     '''
-        To be implemented in subclasses of BSTMap()
+        The _rebalance_* hooks are to be implemented
+        in balanced subclasses of BSTMap(), which can
+        use the rotation methods below.
     '''
     def _rebalance_insert(self, p):
         pass
@@ -94,14 +195,376 @@ class BSTMap(LinkedBinaryTree, MapBase):
     def _rebalance_access(self, p):
         pass
     
-    def _relink(self, p):
-        pass
+    # True if a subclass overrides _rebalance_access(), so that
+    # node-level searches only make a Position when it is used
+    _has_access_hook = False
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._has_access_hook = cls._rebalance_access is not BSTMap._rebalance_access
+    
+    def _access_node(self, node):
+        '''
+            Call the access hook on node, if a
+            subclass implements one.
+        '''
+        if self._has_access_hook:
+            self._rebalance_access(self._make_position(node))
+    
+    def _relink(self, parent, child, make_left_child):
+        '''
+            Relink parent node with child node
+            (child may be None).
+        '''
+        if make_left_child:
+            parent._left = child
+        else:
+            parent._right = child
+        if child is not None:
+            child._parent = parent
     
     def _rotate(self, p):
-        pass
+        '''
+            Rotate position p above its parent.
+            The subtree of p that lies between
+            p and its parent is moved to the parent.
+        '''
+        x = p._node
+        y = x._parent
+        z = y._parent
+        
+        # x takes the place of y below z
+        if z is None:
+            self._root = x
+            x._parent = None
+        else:
+            self._relink(z, x, y is z._left)
+        
+        # Rotate x and y, and transfer middle subtree
+        if x is y._left:
+            self._relink(y, x._right, True)
+            self._relink(x, y, False)
+        else:
+            self._relink(y, x._left, False)
+            self._relink(x, y, True)
     
     def _trinode_restructure(self, p):
+        '''
+            Perform a trinode restructuring of
+            position p with its parent and grandparent,
+            and return the position that becomes the
+            root of the restructured subtree.
+        '''
+        parent = self.parent(p)
+        grandparent = self.parent(parent)
+        # Single rotation if p, parent and grandparent are aligned
+        if (p == self.right(parent)) == (parent == self.right(grandparent)):
+            self._rotate(parent)
+            return parent
+        # Double rotation otherwise
+        else:
+            self._rotate(p)
+            self._rotate(p)
+            return p
+    #---------- Private bulk loading methods ----------
+    def _init_bulk_node(self, node, depth, max_depth):
+        '''
+            Hook called on each node built by
+            _build_sorted(), once its subtrees are built.
+            depth is the depth of node, max_depth the
+            height of the tree. To be implemented in
+            subclasses storing data in their nodes.
+        '''
         pass
+    
+    def _check_sorted_items(self, items):
+        '''
+            Return the list of _Item objects for the
+            (key, value) pairs of the iterable items.
+            Raises ValueError if the keys are not in
+            strictly increasing order.
+        '''
+        result = []
+        prev_key = None
+        for k, v in items:
+            if len(result)>0 and not prev_key<k:
+                raise ValueError(f"Keys must be strictly increasing: {repr(k)} after {repr(prev_key)}")
+            result.append(self._Item(k,v))
+            prev_key = k
+        return result
+    
+    def _build_subtree(self, items, lo, hi, parent, depth, max_depth):
+        '''
+            Return root of a balanced subtree holding
+            items[lo:hi], with the middle item at the root.
+        '''
+        if lo>=hi:
+            return None
+        mid = (lo+hi)//2
+        node = self._Node(items[mid], parent)
+        node._left = self._build_subtree(items, lo, mid, node, depth+1, max_depth)
+        node._right = self._build_subtree(items, mid+1, hi, node, depth+1, max_depth)
+        self._init_bulk_node(node, depth, max_depth)
+        return node
+    
+    def _build_sorted(self, items):
+        '''
+            Replace the contents of the tree by a perfectly
+            balanced tree of the sorted list of _Item objects
+            items, in O(n) time. All nodes at a depth
+            differ by at most 1 from the tree height.
+        '''
+        n = len(items)
+        self._root = self._build_subtree(items, 0, n, None, 0, n.bit_length()-1)
+        self._size = n
+    
+    #---------- Private node-level split and join methods ----------
+    '''
+        The methods below work on detached subtrees,
+        given by their root nodes (None for an empty
+        subtree). Balanced subclasses override
+        _join_nodes() to keep their invariant.
+    '''
+    def _join_nodes(self, left, mid, right):
+        '''
+            Return root of a subtree holding the nodes
+            of left, node mid, and the nodes of right,
+            where all keys of left are lower than the key
+            of mid, itself lower than all keys of right.
+            No rebalancing done in this version.
+        '''
+        mid._parent = None
+        self._relink(mid, left, True)
+        self._relink(mid, right, False)
+        return mid
+    
+    def _expose(self, node):
+        '''
+            Detach and return the two subtrees of node.
+        '''
+        left, right = node._left, node._right
+        node._left = node._right = None
+        if left is not None:
+            left._parent = None
+        if right is not None:
+            right._parent = None
+        return left, right
+    
+    def _split_nodes(self, node, k):
+        '''
+            Split subtree rooted at node by key k.
+            Return a triple (left, found, right), where
+            left and right are the roots of the subtrees
+            of keys lower and greater than k, and found
+            is the node with key k (None if absent).
+            Iterative: the search path is kept on an
+            explicit stack, then joined bottom-up.
+        '''
+        path = []
+        found = None
+        while node is not None:
+            left, right = self._expose(node)
+            key = node._element._key
+            if k<key:
+                path.append((node, right, True))
+                node = left
+            elif key<k:
+                path.append((node, left, False))
+                node = right
+            else:
+                found = node
+                break
+        l, r = (left, right) if found is not None else (None, None)
+        # Rebuild both sides from the deepest node up
+        while len(path)>0:
+            node, sub, went_left = path.pop()
+            if went_left:
+                r = self._join_nodes(r, node, sub)
+            else:
+                l = self._join_nodes(sub, node, l)
+        return l, found, r
+    
+    def _split_last(self, node):
+        '''
+            Remove node with greatest key from the subtree
+            rooted at node. Return the pair (root of the
+            remaining subtree, removed node).
+        '''
+        path = []
+        while True:
+            left, right = self._expose(node)
+            if right is None:
+                break
+            path.append((node, left))
+            node = right
+        last, rest = node, left
+        while len(path)>0:
+            node, left = path.pop()
+            rest = self._join_nodes(left, node, rest)
+        return rest, last
+    
+    def _join2_nodes(self, left, right):
+        '''
+            Join subtrees left and right, where all keys
+            of left are lower than all keys of right.
+        '''
+        if left is None:
+            return right
+        if right is None:
+            return left
+        rest, last = self._split_last(left)
+        return self._join_nodes(rest, last, right)
+    
+    def _set_operation_nodes(self, t1, t2, base, combine):
+        '''
+            Divide-and-conquer driver of the set
+            operations on subtrees t1 and t2, with an
+            explicit stack instead of recursion:
+            - base(t1, t2) returns the result pair
+              (root, count) when t1 or t2 is empty,
+            - otherwise t2 is exposed, t1 is split by the
+              key of t2 into (l1, found, r1), and the
+              results of (l1, l2) and (r1, r2) are merged
+              by combine(left, right, mid, found).
+        '''
+        results = []
+        tasks = [(t1, t2)]
+        while len(tasks)>0:
+            task = tasks.pop()
+            if len(task) == 2:
+                t1, t2 = task
+                if t1 is None or t2 is None:
+                    results.append(base(t1, t2))
+                    continue
+                l2, r2 = self._expose(t2)
+                l1, found, r1 = self._split_nodes(t1, t2._element._key)
+                # Combine runs after both halves, left half first
+                tasks.append((t2, found, None))
+                tasks.append((r1, r2))
+                tasks.append((l1, l2))
+            else:
+                mid, found, _ = task
+                right = results.pop()
+                left = results.pop()
+                results.append(combine(left, right, mid, found))
+        return results.pop()
+    
+    def _union_nodes(self, t1, t2):
+        '''
+            Return (root, dups) for the union of subtrees
+            t1 and t2, where dups is the number of keys
+            in both. Nodes of t1 are kept for common keys,
+            with the values of t2.
+        '''
+        def base(t1, t2):
+            return (t2 if t1 is None else t1), 0
+        def combine(left, right, mid, found):
+            (left, dups_l), (right, dups_r) = left, right
+            if found is None:
+                return self._join_nodes(left, mid, right), dups_l+dups_r
+            found._element._value = mid._element._value
+            self._deprecate_node(mid)
+            return self._join_nodes(left, found, right), dups_l+dups_r+1
+        return self._set_operation_nodes(t1, t2, base, combine)
+    
+    def _intersection_nodes(self, t1, t2):
+        '''
+            Return (root, count) for the intersection of
+            subtrees t1 and t2, keeping the nodes of t1,
+            where count is the size of the intersection.
+        '''
+        def base(t1, t2):
+            return None, 0
+        def combine(left, right, mid, found):
+            (left, count_l), (right, count_r) = left, right
+            self._deprecate_node(mid)
+            if found is None:
+                return self._join2_nodes(left, right), count_l+count_r
+            return self._join_nodes(left, found, right), count_l+count_r+1
+        return self._set_operation_nodes(t1, t2, base, combine)
+    
+    def _difference_nodes(self, t1, t2):
+        '''
+            Return (root, removed) for the subtree of keys
+            of t1 not in t2, where removed is the number
+            of keys of t1 found in t2.
+        '''
+        def base(t1, t2):
+            return t1, 0
+        def combine(left, right, mid, found):
+            (left, removed_l), (right, removed_r) = left, right
+            self._deprecate_node(mid)
+            if found is not None:
+                self._deprecate_node(found)
+            removed = removed_l+removed_r+(0 if found is None else 1)
+            return self._join2_nodes(left, right), removed
+        return self._set_operation_nodes(t1, t2, base, combine)
+    
+    def _finalize_root(self):
+        '''
+            Hook called once a joined or split subtree
+            becomes the whole tree (e.g. to color the
+            root of a red-black tree black).
+        '''
+        pass
+    
+    def _known_size(self, node):
+        '''
+            Return size of subtree rooted at node if
+            stored in the nodes, None otherwise.
+        '''
+        return None
+    
+    def _count_split(self, left, right, total):
+        '''
+            Return the sizes of subtrees left and right,
+            whose sizes add up to total. Walks both in
+            lockstep, in O(min(|left|, |right|)) time,
+            unless subtree sizes are stored in the nodes.
+        '''
+        size = self._known_size(left)
+        if size is not None:
+            return size, total-size
+        a = self._subtree_first_node(left) if left is not None else None
+        b = self._subtree_first_node(right) if right is not None else None
+        count = 0
+        while a is not None and b is not None:
+            a, b = self._after_node(a), self._after_node(b)
+            count += 1
+        if a is None:
+            return count, total-count
+        return total-count, count
+    
+    def _set_subtree(self, root, size):
+        '''
+            Make node root (possibly None) the root of
+            the tree, which holds size nodes.
+            All positions of the map become invalid.
+        '''
+        if root is not None:
+            root._parent = None
+        self._root = root
+        self._size = size
+        self._epoch += 1
+    
+    def _deprecate_node(self, node):
+        '''
+            Mark a node dropped by a set operation as
+            deprecated (as update_sorted() does).
+        '''
+        node._left = node._right = None
+        node._parent = node
+    
+    def _check_same_type(self, other):
+        '''
+            Raises TypeError if other is not a map
+            of the same class as the current one.
+        '''
+        if type(other) is not type(self):
+            raise TypeError("Maps must be of the same type")
+        if other is self:
+            raise ValueError("Cannot combine a map with itself")
+    
     #---------- Public Map methods ----------
     def __getitem__(self, k):
         '''
@@ -111,9 +574,10 @@ class BSTMap(LinkedBinaryTree, MapBase):
         '''
         if self.is_empty():
             raise ValueError("Map is empty")
-        p = self._search_subtree(self.root(), k)
-        if k==p.key():
-            return p.value()
+        node = self._search_node(self._root, k)
+        self._access_node(node)
+        if k==node._element._key:
+            return node._element._value
         else:
             raise ValueError(f"Key \'{repr(k)}\' not found")
     
@@ -121,10 +585,10 @@ class BSTMap(LinkedBinaryTree, MapBase):
         '''
             Generate iterator over all keys in increasing order.
         '''
-        p = self.first()
-        while p is not None:
-            yield p.key()
-            p = self.after(p)
+        node = self._subtree_first_node(self._root) if self._root is not None else None
+        while node is not None:
+            yield node._element._key
+            node = self._after_node(node)
     
     def __setitem__(self, k, v):
         '''
@@ -136,11 +600,12 @@ class BSTMap(LinkedBinaryTree, MapBase):
             self._rebalance_insert(root)
         # If tree is not empty, search for key
         else:
-            p = self._search_subtree(self.root(), k)
+            node = self._search_node(self._root, k)
+            p = self._make_position(node)
             
             # If k already exists in tree, replace value
-            if k == p.key():
-                p.element()._value = v
+            if k == node._element._key:
+                node._element._value = v
                 self._rebalance_access(p)
                 return
             # If k doesn't exist, add node containing (k,v)
@@ -159,14 +624,14 @@ class BSTMap(LinkedBinaryTree, MapBase):
             reshape tree to preserve BST
             property. Calls:
             - LinkedBinaryTree._delete(Position).
-            - LinkedBinaryTree._replace(Position1, Position2).
+            - LinkedBinaryTree._replace(Position, element).
         '''
         self._validate(p)
         
         # Case where p has two children
         if (self.left(p) is not None) and (self.right(p) is not None):
             replacement_pos = self._subtree_last_position(self.left(p))
-            self._replace(p, replacement_pos)
+            self._replace(p, replacement_pos.element())
             p = replacement_pos
         
         # Case where p (now) has at most one child
@@ -204,7 +669,7 @@ class BSTMap(LinkedBinaryTree, MapBase):
         if len(self) == 0:
             return None
         else:
-            return self._subtree_first_position(self.root())
+            return self._make_position(self._subtree_first_node(self._root))
     
     def last(self):
         '''
@@ -215,44 +680,263 @@ class BSTMap(LinkedBinaryTree, MapBase):
         if len(self) == 0:
             return None
         else:
-            return self._subtree_last_position(self.root())
+            return self._make_position(self._subtree_last_node(self._root))
     
     def before(self, p):
         '''
             Return Position just before p
             in BST order.
+            (None if p.key() is lowest)
         '''
-        self._validate(p)
-        # If p has a left child, search for last position
-        if self.left(p) is not None:
-            return self._subtree_last_position(self.left(p))
-        # If p does not have a left child, walk upward
-        ## in tree until ancestor is a right child
-        ## If p.key() is lowest, returns None.
-        else:
-            cur_pos = p
-            cur_pos_parent = self.parent(cur_pos)
-            while (cur_pos_parent is not None) and (cur_pos==self.left(cur_pos_parent)):
-                cur_pos = cur_pos_parent
-                cur_pos_parent = self.parent(cur_pos)
-            return cur_pos_parent
+        node = self._validate(p)
+        return self._make_position(self._before_node(node))
     
     def after(self, p):
         '''
             Return Position right after p
             in BST order.
+            (None if p.key() is greatest)
         '''
-        self._validate(p)
-        # If p has a left child, search for last position
-        if self.right(p) is not None:
-            return self._subtree_first_position(self.right(p))
-        # If p does not have a left child, walk upward
-        ## in tree until ancestor is a right child
-        ## If p.key() is lowest, returns None.
+        node = self._validate(p)
+        return self._make_position(self._after_node(node))
+    
+    #---------- Public ordered search methods ----------
+    def find_ge(self, k):
+        '''
+            Return Position of least key greater
+            than or equal to k (None if no such key).
+        '''
+        node = self._find_node(k)
+        if node is not None and node._element._key<k:
+            node = self._after_node(node)
+        return self._make_position(node)
+    
+    def find_gt(self, k):
+        '''
+            Return Position of least key strictly
+            greater than k (None if no such key).
+        '''
+        node = self._find_node(k)
+        if node is not None and not k<node._element._key:
+            node = self._after_node(node)
+        return self._make_position(node)
+    
+    def find_le(self, k):
+        '''
+            Return Position of greatest key less
+            than or equal to k (None if no such key).
+        '''
+        node = self._find_node(k)
+        if node is not None and k<node._element._key:
+            node = self._before_node(node)
+        return self._make_position(node)
+    
+    def find_lt(self, k):
+        '''
+            Return Position of greatest key strictly
+            less than k (None if no such key).
+        '''
+        node = self._find_node(k)
+        if node is not None and not node._element._key<k:
+            node = self._before_node(node)
+        return self._make_position(node)
+    
+    def find_range(self, start, stop):
+        '''
+            Generate (key, value) pairs with
+            start <= key < stop, in increasing
+            key order. If start (resp. stop) is None,
+            iteration begins with the lowest key
+            (resp. continues to the greatest key).
+            Runs in O(h+s) time for s reported items.
+        '''
+        if self._root is None:
+            return
+        if start is None:
+            node = self._subtree_first_node(self._root)
         else:
-            cur_pos = p
-            cur_pos_parent = self.parent(cur_pos)
-            while (cur_pos_parent is not None) and (cur_pos==self.right(cur_pos_parent)):
-                cur_pos = cur_pos_parent
-                cur_pos_parent = self.parent(cur_pos)
-            return cur_pos_parent
\ No newline at end of file
+            node = self._find_node(start)
+            if node._element._key<start:
+                node = self._after_node(node)
+        while node is not None and (stop is None or node._element._key<stop):
+            yield (node._element._key, node._element._value)
+            node = self._after_node(node)
+    
+    def __reversed__(self):
+        '''
+            Generate iterator over all keys in decreasing order.
+        '''
+        node = self._subtree_last_node(self._root) if self._root is not None else None
+        while node is not None:
+            yield node._element._key
+            node = self._before_node(node)
+    
+    #---------- Public bulk loading methods ----------
+    @classmethod
+    def from_sorted(cls, items):
+        '''
+            Return a new map built in O(n) time from
+            the iterable items of (key, value) pairs,
+            sorted by strictly increasing keys.
+            Raises ValueError if items are not sorted.
+        '''
+        M = cls()
+        M._build_sorted(M._check_sorted_items(items))
+        return M
+    
+    def update_sorted(self, items):
+        '''
+            Insert the (key, value) pairs of the iterable
+            items, sorted by strictly increasing keys, and
+            rebuild a balanced tree in O(n+m) time.
+            Values of existing keys are replaced.
+            Positions of the map become invalid.
+            Raises ValueError if items are not sorted (in
+            which case the map is left unchanged).
+        '''
+        new_items = self._check_sorted_items(items)
+        
+        # Collect nodes of the current tree in key order
+        old_nodes = []
+        node = self._subtree_first_node(self._root) if self._root is not None else None
+        while node is not None:
+            old_nodes.append(node)
+            node = self._after_node(node)
+        
+        # Merge current items with new items
+        merged = []
+        i, j = 0, 0
+        while i<len(old_nodes) and j<len(new_items):
+            old_item, new_item = old_nodes[i]._element, new_items[j]
+            if old_item._key<new_item._key:
+                merged.append(old_item)
+                i += 1
+            elif new_item._key<old_item._key:
+                merged.append(new_item)
+                j += 1
+            else:
+                old_item._value = new_item._value
+                merged.append(old_item)
+                i += 1
+                j += 1
+        merged.extend(node._element for node in old_nodes[i:])
+        merged.extend(new_items[j:])
+        
+        # Deprecate old nodes and rebuild
+        for node in old_nodes:
+            node._parent = node
+        self._build_sorted(merged)
+    
+    def freeze(self, typecode=None):
+        '''
+            Return an immutable FrozenTreeMap with
+            the items of the map, stored in a
+            cache-friendly array layout, in O(n) time.
+            If typecode is not None, keys are converted
+            by an array.array of this type (e.g. 'q' or 'd').
+            thaw() on the result returns a map of the
+            same class as the current one.
+        '''
+        from .frozen_tree_map import FrozenTreeMap
+        items = []
+        node = self._subtree_first_node(self._root) if self._root is not None else None
+        while node is not None:
+            items.append((node._element._key, node._element._value))
+            node = self._after_node(node)
+        return FrozenTreeMap(items, typecode, type(self))
+    
+    #---------- Public split, join and set methods ----------
+    '''
+        These methods move nodes between maps without
+        copying them. On balanced subclasses of BSTMap,
+        join takes O(log n) time and the set operations
+        take O(m log(n/m+1)) time (m<=n being the smaller
+        size). split restructures the tree in O(log n)
+        time, but must then count the sizes of the two
+        parts: this takes O(min(m, n-m)) time for parts
+        of sizes m and n-m, unless the nodes store their
+        subtree sizes (O(log n) for OrderStatisticTreeMap).
+        Maps given as arguments are left empty.
+        Positions of the current map and of the maps
+        given as arguments are invalidated (nodes are
+        moved to other maps, or dropped and deprecated).
+    '''
+    def split(self, k):
+        '''
+            Split the map by key k. Return a pair of
+            new maps with the keys lower than k and
+            the keys greater than or equal to k.
+            The current map is left empty.
+            Runs in O(log n+min(m, n-m)) time on balanced
+            subclasses, m being the size of the lower map
+            (O(log n) if subtree sizes are stored).
+        '''
+        total = len(self)
+        left, found, right = self._split_nodes(self._root, k)
+        if found is not None:
+            right = self._join_nodes(None, found, right)
+        left_size, right_size = self._count_split(left, right, total)
+        
+        lower, upper = type(self)(), type(self)()
+        lower._set_subtree(left, left_size)
+        upper._set_subtree(right, right_size)
+        lower._finalize_root()
+        upper._finalize_root()
+        self._set_subtree(None, 0)
+        return lower, upper
+    
+    @classmethod
+    def join(cls, left, right):
+        '''
+            Return a new map with the items of maps
+            left and right, where all keys of left
+            are lower than all keys of right.
+            left and right are left empty.
+            Raises ValueError if keys are not ordered.
+        '''
+        if type(left) is not cls or type(right) is not cls:
+            raise TypeError(f"Maps must be of type {cls.__name__}")
+        if not (left.is_empty() or right.is_empty() or left.last().key()<right.first().key()):
+            raise ValueError("All keys of left must be lower than all keys of right")
+        M = cls()
+        M._set_subtree(M._join2_nodes(left._root, right._root), len(left)+len(right))
+        M._finalize_root()
+        left._set_subtree(None, 0)
+        right._set_subtree(None, 0)
+        return M
+    
+    def union(self, other):
+        '''
+            Insert all items of map other into the
+            current map. Values of other replace those
+            of common keys. other is left empty.
+        '''
+        self._check_same_type(other)
+        root, dups = self._union_nodes(self._root, other._root)
+        self._set_subtree(root, len(self)+len(other)-dups)
+        self._finalize_root()
+        other._set_subtree(None, 0)
+    
+    def intersection(self, other):
+        '''
+            Keep only the items of the current map
+            whose keys are in map other.
+            other is left empty.
+        '''
+        self._check_same_type(other)
+        root, count = self._intersection_nodes(self._root, other._root)
+        self._set_subtree(root, count)
+        self._finalize_root()
+        other._set_subtree(None, 0)
+    
+    def difference(self, other):
+        '''
+            Remove from the current map all items
+            whose keys are in map other.
+            other is left empty.
+        '''
+        self._check_same_type(other)
+        root, removed = self._difference_nodes(self._root, other._root)
+        self._set_subtree(root, len(self)-removed)
+        self._finalize_root()
+        other._set_subtree(None, 0)
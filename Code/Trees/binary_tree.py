@@ -64,15 +64,26 @@ class BinaryTree(Tree):
             for p in self._subtree_inorder(self.root()):
                 yield p
 
+    @staticmethod
+    def _iter_inorder(start, left, right):
+        """Generate start and its descendants in inorder, where left(x) and right(x) give the children of x.
+
+        An explicit stack holds the nodes whose left subtree is being visited,
+        so each yield costs O(1) amortized time, without recursion.
+        """
+        stack = []
+        x = start
+        while stack or x is not None:
+            while x is not None:                # go down the left spine
+                stack.append(x)
+                x = left(x)
+            x = stack.pop()
+            yield x                             # visit x between its subtrees
+            x = right(x)                        # then traverse its right subtree
+
     def _subtree_inorder(self, p):
         """Generate an inorder iteration of positions in subtree rooted at p."""
-        if self.left(p) is not None:          # if left child exists, traverse its subtree
-            for other in self._subtree_inorder(self.left(p)):
-                yield other
-        yield p                               # visit p between its subtrees
-        if self.right(p) is not None:         # if right child exists, traverse its subtree
-            for other in self._subtree_inorder(self.right(p)):
-                yield other
+        return self._iter_inorder(p, self.left, self.right)
 
     # override inherited version to make inorder the default
     def positions(self):
@@ -28,7 +28,7 @@ class BinaryTree(object):
             the tree 
         '''
         # Pre-allocate 
-        __slots__ = "_element", "_parent", "_left", "_right"
+        __slots__ = "_element", "_parent", "_left", "_right", "_num_children"
         def __init__(self, element, parent=None, left=None, right=None):
             self._element = element
             self._parent = parent
@@ -120,7 +120,7 @@ class BinaryTree(object):
             Constructor of linked binary tree class
         '''
         self._root = None
-        self._size = 0
+        self._num_nodes = 0
         
     ##### Node addition, deletion, and modification methods
     def _add_root(self, e):
@@ -314,11 +314,11 @@ class BinaryTree(object):
         
     def right(self, p):
         '''
-            Return the left child of the node 
+            Return the right child of the node 
             at position p
         '''
         node = self._validate(p)
-        return self._make_position(node._left)
+        return self._make_position(node._right)
     
     def children(self, p):
         '''
@@ -409,13 +409,28 @@ class BinaryTree(object):
             for p in inorder(self, self.root()):
                 yield p
     
-    def breadth_first(self):
+    def breadth_first(self, p = None, max_depth = None):
         '''
-            Breadth first traversal
+            Breadth first traversal, starting
+            from the root or from position p.
+            Positions more than max_depth levels
+            below the start are not reported.
         '''
         if not self.is_empty():
-            for p in breadth_first(self):
-                yield p
+            for q in breadth_first(self, p, max_depth):
+                yield q
+    
+    def breadth_first_levels(self, p = None, max_depth = None):
+        '''
+            Breadth first traversal yielding
+            one list of positions per level,
+            starting from the root or from
+            position p, and stopping after
+            level max_depth (if not None).
+        '''
+        if not self.is_empty():
+            for level in breadth_first_levels(self, p, max_depth):
+                yield level
     
     
     ##### Iterator generation methods
@@ -425,7 +440,7 @@ class BinaryTree(object):
             in the current tree, depending on the
             traversal algorithm selected.
         '''
-        if traversal not in TRAVERSAL_KEYWORDS:
+        if traversal not in self.TRAVERSAL_KEYWORDS:
             raise ValueError("Unrecognized traversal algorithm")
         
         elif traversal == "preorder":
@@ -497,17 +512,51 @@ def inorder(T: BinaryTree, p: BinaryTree.Position):
             yield other
     
     
-    def breadth_first(T: BinaryTree):
+def breadth_first(T: BinaryTree, p: BinaryTree.Position = None, max_depth = None):
     '''
-        Breadth first traversal of 
+        Breadth first traversal of the subtree
+        of T rooted at position p (the root if
+        p is None).
+        Yields an iterator for the subtree 
+        positions, level by level, down to
+        max_depth levels below p (if not None).
     '''
     if not T.is_empty():
+        if p == None:
+            p = T.root()
         # Known positions not yet yielded
         pos_queue = deque()
-        pos_queue.append(T.root())
+        pos_queue.append(p)
+        depth = 0
         
         while len(pos_queue)>0:
-            p = pos_queue.pop()
-            yield p
-            for c in T.children(p):
-                pos_queue.append(c)
\ No newline at end of file
+            expand = (max_depth == None) or (depth<max_depth)
+            # Positions of current level are at the front of the queue
+            for _ in range(len(pos_queue)):
+                q = pos_queue.popleft()
+                yield q
+                if expand:
+                    pos_queue.extend(T.children(q))
+            depth += 1
+
+def breadth_first_levels(T: BinaryTree, p: BinaryTree.Position = None, max_depth = None):
+    '''
+        Level by level traversal of the subtree
+        of T rooted at position p (the root if
+        p is None).
+        Yields one list of positions per level,
+        down to max_depth levels below p
+        (if not None).
+    '''
+    if not T.is_empty():
+        if p == None:
+            p = T.root()
+        level = [p]
+        depth = 0
+        
+        while len(level)>0:
+            yield level
+            if (max_depth != None) and (depth>=max_depth):
+                return
+            level = [c for q in level for c in T.children(q)]
+            depth += 1
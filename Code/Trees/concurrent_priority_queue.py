@@ -0,0 +1,340 @@
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager
+from queue import Empty, Full
+from time import perf_counter
+
+from .heap_priority_queue import PriorityQueueBase, HeapPriorityQ
+
+class ConcurrentPriorityQ(PriorityQueueBase):
+    '''
+        Thread-safe and asyncio-aware wrapper
+        around a priority queue (a HeapPriorityQ
+        by default).
+        - get() blocks until an item is added,
+          and get_async() awaits it from an
+          event loop, without polling.
+        - If maxsize>0, put() blocks while the
+          queue is full (backpressure).
+        - put_many() and get_many() move a batch
+          of items with one lock acquisition.
+        Like queue.Queue, blocking calls raise
+        queue.Empty or queue.Full on timeout.
+        The time spent waiting for the internal
+        lock is reported by lock_stats().
+    '''
+    #---------- Constructor ----------
+    def __init__(self, maxsize=0, queue=None):
+        '''
+            Constructor for the concurrent queue.
+            maxsize is the max. number of items
+            (no limit if maxsize<=0).
+            queue is the wrapped PriorityQueueBase
+            instance, a new HeapPriorityQ if None.
+        '''
+        self._queue = queue if queue is not None else HeapPriorityQ()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # (loop, future) pairs of coroutines awaiting get/put
+        self._get_waiters = deque()
+        self._put_waiters = deque()
+        # Lock contention statistics
+        self._lock_count = 0
+        self._lock_wait = 0.0
+
+    #---------- Private methods ----------
+    @contextmanager
+    def _locked(self):
+        '''
+            Acquire the internal lock, recording
+            the time spent waiting for it.
+        '''
+        t0 = perf_counter()
+        self._lock.acquire()
+        try:
+            self._lock_wait += perf_counter()-t0
+            self._lock_count += 1
+            yield
+        finally:
+            self._lock.release()
+
+    def _is_full(self):
+        '''
+            Return True if the queue has reached maxsize.
+        '''
+        return self._maxsize>0 and len(self._queue)>=self._maxsize
+
+    def _free_slots(self):
+        '''
+            Return the number of items that can be added
+            before the queue is full (None if unbounded).
+        '''
+        if self._maxsize<=0:
+            return None
+        return max(self._maxsize-len(self._queue), 0)
+
+    @staticmethod
+    def _set_waiter(fut):
+        '''
+            Wake a coroutine waiting on future fut.
+        '''
+        if not fut.done():
+            fut.set_result(None)
+
+    def _wake_async(self, waiters):
+        '''
+            Wake all coroutines in waiters. They
+            re-check the queue state when resumed.
+            Must be called with the lock held.
+        '''
+        while len(waiters)>0:
+            loop, fut = waiters.popleft()
+            if not fut.done():
+                loop.call_soon_threadsafe(self._set_waiter, fut)
+
+    def _item_added(self, n=1):
+        '''
+            Notify getters that n items were added.
+        '''
+        self._not_empty.notify(n)
+        self._wake_async(self._get_waiters)
+
+    def _item_removed(self, n=1):
+        '''
+            Notify putters that n items were removed.
+        '''
+        if self._maxsize>0:
+            self._not_full.notify(n)
+            self._wake_async(self._put_waiters)
+
+    def _wait(self, cond, predicate, block, deadline, error):
+        '''
+            Wait on condition cond while predicate()
+            is True. Raises error if block is False
+            or if the deadline is reached.
+            Must be called with the lock held.
+        '''
+        while predicate():
+            if not block:
+                raise error
+            if deadline is None:
+                cond.wait()
+            else:
+                remaining = deadline-perf_counter()
+                if remaining<=0:
+                    raise error
+                cond.wait(remaining)
+
+    @staticmethod
+    def _deadline(timeout):
+        '''
+            Return the deadline corresponding to timeout.
+            Raises ValueError if timeout is negative.
+        '''
+        if timeout is None:
+            return None
+        if timeout<0:
+            raise ValueError("timeout must be a non-negative number")
+        return perf_counter()+timeout
+
+    def _insert(self, pairs):
+        '''
+            Insert a list of (k,v) pairs in the
+            wrapped queue, in bulk if supported.
+        '''
+        if hasattr(self._queue, "extend"):
+            self._queue.extend(pairs)
+        else:
+            for k, v in pairs:
+                self._queue.add(k,v)
+
+    #---------- Public methods (threads) ----------
+    def __len__(self):
+        '''
+            Return number of elements stored in the priority queue
+        '''
+        return len(self._queue)
+
+    def min(self):
+        '''
+            Return (key, value) tuple corresonding to minimal element
+            of the priority queue.
+            Raises ValueError if the queue is empty.
+        '''
+        with self._locked():
+            return self._queue.min()
+
+    def put(self, k, v, block=True, timeout=None):
+        '''
+            Add key-value item (k,v) to the priority queue.
+            If the queue is full, wait for a free slot
+            (at most timeout seconds if not None).
+            Raises queue.Full if no slot was freed.
+        '''
+        deadline = self._deadline(timeout)
+        with self._locked():
+            self._wait(self._not_full, self._is_full, block, deadline, Full)
+            self._queue.add(k,v)
+            self._item_added()
+
+    def add(self, k, v):
+        '''
+            Add key-value item (k,v) without blocking.
+            Raises queue.Full if the queue is full.
+        '''
+        self.put(k, v, block=False)
+
+    def put_many(self, pairs, block=True, timeout=None):
+        '''
+            Add all (key, value) pairs of the iterable
+            pairs, under a single lock acquisition
+            if the queue has enough free slots.
+            Raises queue.Full on timeout, in which case
+            the pairs inserted so far remain queued.
+        '''
+        pairs = list(pairs)
+        deadline = self._deadline(timeout)
+        i = 0
+        with self._locked():
+            while i<len(pairs):
+                self._wait(self._not_full, self._is_full, block, deadline, Full)
+                room = self._free_slots()
+                batch = pairs[i:] if room is None else pairs[i:i+room]
+                self._insert(batch)
+                self._item_added(len(batch))
+                i += len(batch)
+
+    def get(self, block=True, timeout=None):
+        '''
+            Remove and return minimal (k,v) item of
+            the priority queue. If the queue is empty,
+            wait for an item to be added (at most
+            timeout seconds if not None).
+            Raises queue.Empty if no item was added.
+        '''
+        deadline = self._deadline(timeout)
+        with self._locked():
+            self._wait(self._not_empty, self._queue.is_empty, block, deadline, Empty)
+            item = self._queue.remove_min()
+            self._item_removed()
+            return item
+
+    def remove_min(self):
+        '''
+            Remove and return minimal element of the priority
+            queue without blocking.
+            Raises ValueError if the queue is empty.
+        '''
+        with self._locked():
+            item = self._queue.remove_min()
+            self._item_removed()
+            return item
+
+    def get_many(self, n, block=True, timeout=None):
+        '''
+            Remove and return a list of at most n
+            (k,v) items in increasing key order,
+            under a single lock acquisition. Waits
+            as get() until at least one is available.
+            Raises queue.Empty if no item was added.
+        '''
+        deadline = self._deadline(timeout)
+        with self._locked():
+            self._wait(self._not_empty, self._queue.is_empty, block, deadline, Empty)
+            items = [self._queue.remove_min() for _ in range(min(n, len(self._queue)))]
+            self._item_removed(len(items))
+            return items
+
+    #---------- Public methods (asyncio) ----------
+    async def _wait_async(self, predicate, waiters, deadline, error):
+        '''
+            Await until predicate() is False, then
+            return with the lock held.
+            Raises error if the deadline is reached.
+        '''
+        loop = asyncio.get_running_loop()
+        while True:
+            t0 = perf_counter()
+            self._lock.acquire()
+            self._lock_wait += perf_counter()-t0
+            self._lock_count += 1
+            if not predicate():
+                return
+            # Give up before registering a waiter if the deadline has passed
+            if deadline is not None and deadline-perf_counter()<=0:
+                self._lock.release()
+                raise error
+            fut = loop.create_future()
+            waiters.append((loop, fut))
+            self._lock.release()
+
+            try:
+                if deadline is None:
+                    await fut
+                else:
+                    await asyncio.wait_for(fut, deadline-perf_counter())
+            except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+                # Unregister the waiter, unless a wake-up already removed it
+                with self._locked():
+                    try:
+                        waiters.remove((loop, fut))
+                    except ValueError:
+                        pass
+                if isinstance(exc, asyncio.TimeoutError):
+                    raise error from None
+                raise
+
+    async def get_async(self, timeout=None):
+        '''
+            Coroutine version of get(): remove and
+            return minimal (k,v) item, awaiting an
+            add() from any thread or coroutine if
+            the queue is empty.
+            Raises queue.Empty on timeout.
+        '''
+        deadline = self._deadline(timeout)
+        await self._wait_async(self._queue.is_empty, self._get_waiters, deadline, Empty)
+        try:
+            item = self._queue.remove_min()
+            self._item_removed()
+            return item
+        finally:
+            self._lock.release()
+
+    async def put_async(self, k, v, timeout=None):
+        '''
+            Coroutine version of put(): add item
+            (k,v), awaiting a free slot if the
+            queue is full.
+            Raises queue.Full on timeout.
+        '''
+        deadline = self._deadline(timeout)
+        await self._wait_async(self._is_full, self._put_waiters, deadline, Full)
+        try:
+            self._queue.add(k,v)
+            self._item_added()
+        finally:
+            self._lock.release()
+
+    #---------- Lock statistics ----------
+    def lock_stats(self):
+        '''
+            Return a dictionary with the number of
+            lock acquisitions and the total and mean
+            time (in seconds) spent waiting for the lock.
+        '''
+        count = self._lock_count
+        return {"acquisitions": count,
+                "total_wait": self._lock_wait,
+                "mean_wait": self._lock_wait/count if count>0 else 0.0}
+
+    def reset_lock_stats(self):
+        '''
+            Reset lock contention statistics.
+        '''
+        with self._locked():
+            self._lock_count = 0
+            self._lock_wait = 0.0
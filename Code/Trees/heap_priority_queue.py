@@ -51,13 +51,26 @@ class HeapPriorityQ(PriorityQueueBase):
     '''
         Implementation of a priotiy queue 
         as an array-based heap.
+        The heap is binary by default, and
+        a d-ary layout (each node has up to d
+        children) can be chosen with arity.
     '''
     #---------- Constructor ----------
-    def __init__(self):
-        '''
-            Constructor for priority queue
-        '''
+    def __init__(self, contents=(), arity=2):
+        '''
+            Constructor for priority queue.
+            contents is an optional iterable of
+            (key, value) pairs, loaded in O(n)
+            time with bottom-up heap construction.
+            arity is the max. number of children
+            of a node (2, 4 or 8 in practice).
+            Raises ValueError if arity<2.
+        '''
+        if arity<2:
+            raise ValueError("Heap arity must be at least 2")
+        self._arity = arity
         self._data = []
+        self.extend(contents)
         
     #---------- Private methods ----------
     
@@ -66,13 +79,13 @@ class HeapPriorityQ(PriorityQueueBase):
             Return index of parent of node at position i.
             (Should not be called for the root)
         '''
-        return (i-1)//2
+        return (i-1)//self._arity
     
     def _left_child(self,i):
         '''
-            Return index of left child of node at position i.
+            Return index of left (first) child of node at position i.
         '''
-        return 2*i+1
+        return self._arity*i+1
     
     def _has_left(self, i):
         '''
@@ -82,9 +95,9 @@ class HeapPriorityQ(PriorityQueueBase):
     
     def _right_child(self,i):
         '''
-            Return index of right child of node at position i.
+            Return index of right (last) child of node at position i.
         '''
-        return 2*(i+1)
+        return self._arity*(i+1)
     
     def _has_right(self, i):
         '''
@@ -125,17 +138,44 @@ class HeapPriorityQ(PriorityQueueBase):
             lchild = self._left_child(i)
             min_child = lchild
             
-            # Check if node has right child and if lower than left child
-            if self._has_right(i):
-                rchild = self._right_child(i)
-                if self._data[rchild]<self._data[lchild]:
-                    min_child = rchild
+            # Scan the (at most d) children for the lowest one
+            last_child = min(self._right_child(i), len(self._data)-1)
+            for c in range(lchild+1, last_child+1):
+                if self._data[c]<self._data[min_child]:
+                    min_child = c
             
             # Check if i and min_child need swap
             if self._data[min_child]<self._data[i]:
                 self._swap(min_child, i)
                 self._bubble_down(min_child)
-            
+    
+    def _heapify(self):
+        '''
+            Bottom-up heap construction.
+            Execute down-heap bubbling on every
+            non-leaf node, from the last one up
+            to the root. Runs in O(n) time.
+        '''
+        start = self._parent(len(self._data)-1)
+        for j in range(start, -1, -1):
+            self._bubble_down(j)
+    
+    def _extend_items(self, new_items):
+        '''
+            Insert a list of already built items,
+            either by up-heap bubbling each of them
+            or by rebuilding the heap bottom-up.
+        '''
+        n, k = len(self._data), len(new_items)
+        
+        # Rebuild if k up-heap bubblings cost more than a heapify
+        if k*(n+k).bit_length() > n+k:
+            self._data.extend(new_items)
+            self._heapify()
+        else:
+            for item in new_items:
+                self._data.append(item)
+                self._bubble_up(len(self._data)-1)
         
     
     #---------- Public methods ----------
@@ -168,6 +208,27 @@ class HeapPriorityQ(PriorityQueueBase):
         
         # Execute up-heap bubbling
         self._bubble_up(len(self._data)-1)
+    
+    def extend(self, contents):
+        '''
+            Add all (key, value) pairs of the
+            iterable contents to the priority queue.
+            If the batch is large relative to the
+            current size, the pairs are appended and
+            the whole heap is rebuilt bottom-up in
+            O(n+k) time, instead of O(k log(n+k))
+            for k successive calls to add().
+        '''
+        self._extend_items([self._Item(k,v) for k,v in contents])
+    
+    @classmethod
+    def from_pairs(cls, contents):
+        '''
+            Return a new priority queue built
+            in O(n) time from an iterable of
+            (key, value) pairs.
+        '''
+        return cls(contents)
         
     
     def remove_min(self):
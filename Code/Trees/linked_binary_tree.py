@@ -67,6 +67,21 @@ class LinkedBinaryTree(BinaryTree):
         """Return Position instance for given node (or None if no node)."""
         return self.Position(self, node) if node is not None else None
 
+    #-------------------------- node-level traversal hooks --------------------------
+    def _to_node(self, p):
+        """Return the node at Position p, if position is valid."""
+        return self._validate(p)
+
+    def _node_parent(self, node):
+        """Return the parent node of node (or None if node is the root)."""
+        return node._parent
+
+    def _node_children(self, node):
+        """Return a tuple of the children nodes of node."""
+        if node._left is None:
+            return (node._right,) if node._right is not None else ()
+        return (node._left, node._right) if node._right is not None else (node._left,)
+
     #-------------------------- binary tree constructor --------------------------
     def __init__(self):
         """Create an initially empty binary tree."""
@@ -0,0 +1,136 @@
+from array import array
+
+from .heap_priority_queue import PriorityQueueBase
+
+class NumericHeapPriorityQ(PriorityQueueBase):
+    '''
+        Implementation of a priority queue as an
+        array-based binary heap, for numeric keys.
+        Keys are stored in a typed array.array
+        ('d' for floats, 'q' for 64-bit ints) and
+        values in a parallel list, so that no
+        _Item object is allocated per entry and
+        keys are compared as plain numbers.
+    '''
+    #---------- Constructor ----------
+    def __init__(self, contents=(), typecode='d'):
+        '''
+            Constructor for priority queue.
+            contents is an optional iterable of
+            (key, value) pairs, loaded in O(n)
+            time with bottom-up heap construction.
+            typecode is the array.array type of the
+            keys ('d' or 'q').
+            Raises ValueError for other typecodes.
+        '''
+        if typecode not in ('d', 'q'):
+            raise ValueError("typecode must be 'd' (float) or 'q' (int)")
+        self._keys = array(typecode)
+        self._values = []
+        for k, v in contents:
+            self._keys.append(k)
+            self._values.append(v)
+        if len(self._keys)>1:
+            self._heapify()
+
+    #---------- Private methods ----------
+    def _bubble_up(self, i):
+        '''
+            Execute up-heap bubbling on node
+            at position i.
+            Parents are shifted down into the hole
+            left by the moving entry, which is
+            written once at its final position.
+        '''
+        keys, values = self._keys, self._values
+        k, v = keys[i], values[i]
+        while i>0:
+            p = (i-1)>>1
+            if k<keys[p]:
+                keys[i] = keys[p]
+                values[i] = values[p]
+                i = p
+            else:
+                break
+        keys[i] = k
+        values[i] = v
+
+    def _bubble_down(self, i):
+        '''
+            Execute down-heap bubbling on node
+            at position i.
+            Smaller children are shifted up into
+            the hole left by the moving entry.
+        '''
+        keys, values = self._keys, self._values
+        n = len(keys)
+        k, v = keys[i], values[i]
+        c = 2*i+1
+        while c<n:
+            # Select the child with lowest key
+            if c+1<n and keys[c+1]<keys[c]:
+                c += 1
+            if keys[c]<k:
+                keys[i] = keys[c]
+                values[i] = values[c]
+                i = c
+                c = 2*i+1
+            else:
+                break
+        keys[i] = k
+        values[i] = v
+
+    def _heapify(self):
+        '''
+            Bottom-up heap construction in O(n) time.
+        '''
+        for j in range((len(self._keys)-2)//2, -1, -1):
+            self._bubble_down(j)
+
+    #---------- Public methods ----------
+    def __len__(self):
+        '''
+            Return number of elements stored in the priority queue
+        '''
+        return len(self._keys)
+
+    def min(self):
+        '''
+            Return (key, value) tuple corresonding to minimal element
+            of the priority queue.
+            Raises ValueError if the queue is empty.
+        '''
+        if len(self._keys) == 0:
+            raise ValueError("Cannot return min element of an empty priority queue")
+        return (self._keys[0], self._values[0])
+
+    def add(self, k, v):
+        '''
+            Add key-value item (k,v) to the priority queue.
+            Raises TypeError if k does not fit the
+            typecode of the key array.
+        '''
+        self._keys.append(k)
+        self._values.append(v)
+        self._bubble_up(len(self._keys)-1)
+
+    def remove_min(self):
+        '''
+            Remove and return minimal element of the priority
+            queue, and reshape heap.
+            Raises ValueError if the queue is empty.
+        '''
+        keys, values = self._keys, self._values
+        if len(keys) == 0:
+            raise ValueError("Cannot remove minimal element of an empty priority queue")
+
+        min_key, min_value = keys[0], values[0]
+
+        # Move last entry to the root, then bubble down
+        last_key, last_value = keys.pop(), values.pop()
+        if len(keys)>0:
+            keys[0] = last_key
+            values[0] = last_value
+            self._bubble_down(0)
+
+        return (min_key, min_value)
@@ -0,0 +1,155 @@
+from .avl_tree_map import AVLTreeMap
+
+class OrderStatisticTreeMap(AVLTreeMap):
+    '''
+        Implementation of a map as an AVL tree
+        augmented with subtree sizes.
+        Each node stores the number of nodes of its
+        subtree, kept up to date on insertion, deletion
+        and rotation. This allows rank and selection
+        queries in O(log n) time:
+        - rank(k): number of keys lower than k,
+        - select(i): Position of the i-th lowest key,
+        - count_range(lo, hi): number of keys in [lo, hi),
+        - by_index[i]: (key, value) pair of the i-th lowest key.
+    '''
+    #---------- Nested _Node class ----------
+    class _Node(AVLTreeMap._Node):
+        '''
+            Node class with a subtree size attribute.
+        '''
+        __slots__ = '_size'
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            super().__init__(element, parent, left, right)
+            self._size = 1
+
+    #---------- Nested index view class ----------
+    class _IndexView(object):
+        '''
+            Read-only sequence view of the items of an
+            OrderStatisticTreeMap, indexed by rank.
+        '''
+        __slots__ = '_map'
+
+        def __init__(self, tree_map):
+            self._map = tree_map
+
+        def __len__(self):
+            return len(self._map)
+
+        def __getitem__(self, i):
+            '''
+                Return (key, value) pair of rank i
+                (negative indices count from the end),
+                or a list of pairs for a slice.
+            '''
+            if isinstance(i, slice):
+                return [self[j] for j in range(*i.indices(len(self._map)))]
+            p = self._map.select(i)
+            return (p.key(), p.value())
+
+    #---------- Private size methods ----------
+    @staticmethod
+    def _node_size(node):
+        return node._size if node is not None else 0
+
+    def _recompute_size(self, node):
+        node._size = 1+self._node_size(node._left)+self._node_size(node._right)
+
+    def _add_to_path(self, node, delta):
+        '''
+            Add delta to the sizes of node
+            and of all its ancestors.
+        '''
+        while node is not None:
+            node._size += delta
+            node = node._parent
+
+    #---------- Restructuring and rebalancing hooks ----------
+    def _rotate(self, p):
+        '''
+            Rotate position p above its parent,
+            and update the sizes of both nodes.
+        '''
+        x = p._node
+        y = x._parent
+        super()._rotate(p)
+        self._recompute_size(y)
+        self._recompute_size(x)
+
+    def _update_node(self, node):
+        super()._update_node(node)
+        self._recompute_size(node)
+
+    def _known_size(self, node):
+        return self._node_size(node)
+
+    def _rebalance_insert(self, p):
+        self._add_to_path(p._node._parent, 1)
+        super()._rebalance_insert(p)
+
+    def _rebalance_delete(self, p):
+        if p is not None:
+            self._add_to_path(p._node, -1)
+        super()._rebalance_delete(p)
+
+    #---------- Public order statistic methods ----------
+    def rank(self, k):
+        '''
+            Return the number of keys lower than k.
+        '''
+        r = 0
+        node = self._root
+        while node is not None:
+            key = node._element._key
+            if k<key:
+                node = node._left
+            elif k==key:
+                return r+self._node_size(node._left)
+            else:
+                r += self._node_size(node._left)+1
+                node = node._right
+        return r
+
+    def select(self, i):
+        '''
+            Return Position of the key of rank i
+            (i.e. the (i+1)-th lowest key). Negative
+            values of i count from the greatest key.
+            Raises IndexError if i is out of range.
+        '''
+        n = len(self)
+        if i<0:
+            i += n
+        if not 0<=i<n:
+            raise IndexError(f"Index {i} out of range for map of size {n}")
+        node = self._root
+        while True:
+            left_size = self._node_size(node._left)
+            if i<left_size:
+                node = node._left
+            elif i==left_size:
+                return self._make_position(node)
+            else:
+                i -= left_size+1
+                node = node._right
+
+    def count_range(self, lo, hi):
+        '''
+            Return the number of keys k with lo <= k < hi.
+            If lo (resp. hi) is None, the range is not
+            bounded from below (resp. above).
+        '''
+        lower = 0 if lo is None else self.rank(lo)
+        upper = len(self) if hi is None else self.rank(hi)
+        return max(upper-lower, 0)
+
+    @property
+    def by_index(self):
+        '''
+            Sequence view of the (key, value) pairs
+            indexed by rank, e.g. M.by_index[i] or
+            M.by_index[-10:].
+        '''
+        return self._IndexView(self)
@@ -0,0 +1,249 @@
+from .heap_priority_queue import PriorityQueueBase
+
+class PairingHeapPriorityQ(PriorityQueueBase):
+    '''
+        Implementation of a meldable priority
+        queue as a pairing heap.
+        - add() and meld() run in O(1) time.
+        - remove_min() runs in amortized O(log n) time.
+        - add() returns a locator, which can be passed
+          to update() (decrease-key) and remove().
+        Each node is linked to its first child and
+        to its next sibling, and to the previous
+        node in its sibling list (or its parent
+        if it is a first child).
+        Locators refer to an owner cell, a list holding
+        either their heap or the cell of the heap they
+        were melded into, so that locators of another
+        heap are rejected.
+    '''
+    #---------- Nested Locator class ----------
+    class Locator(PriorityQueueBase._Item):
+        '''
+            Node of the pairing heap, also used
+            as a handle on the (key, value) item.
+        '''
+        __slots__ = '_child', '_sibling', '_prev', '_owner'
+
+        def __init__(self, k, v, owner=None):
+            super().__init__(k,v)
+            self._child = None
+            self._sibling = None
+            self._prev = None
+            self._owner = owner
+
+    #---------- Constructor ----------
+    def __init__(self, contents=()):
+        '''
+            Constructor for priority queue.
+            contents is an optional iterable of
+            (key, value) pairs.
+        '''
+        self._root = None
+        self._size = 0
+        self._owner = [self]
+        for k, v in contents:
+            self.add(k,v)
+
+    #---------- Private methods ----------
+    def _link(self, a, b):
+        '''
+            Link the two detached heap-ordered trees
+            rooted at nodes a and b, and return the
+            root of the resulting tree.
+        '''
+        if b<a:
+            a, b = b, a
+        # b becomes the first child of a
+        b._sibling = a._child
+        if a._child is not None:
+            a._child._prev = b
+        a._child = b
+        b._prev = a
+        return a
+
+    def _detach(self, node):
+        '''
+            Cut the subtree rooted at node (not the
+            root of the heap) from its sibling list.
+        '''
+        prev = node._prev
+        if prev._child is node:
+            prev._child = node._sibling
+        else:
+            prev._sibling = node._sibling
+        if node._sibling is not None:
+            node._sibling._prev = prev
+        node._prev = None
+        node._sibling = None
+
+    def _merge_pairs(self, first):
+        '''
+            Two-pass pairing of the sibling list
+            starting at node first. Return the root
+            of the merged tree (None if first is None).
+        '''
+        # First pass: link siblings by pairs, left to right
+        pairs = []
+        node = first
+        while node is not None:
+            a = node
+            b = a._sibling
+            node = b._sibling if b is not None else None
+            a._prev = a._sibling = None
+            if b is not None:
+                b._prev = b._sibling = None
+                a = self._link(a, b)
+            pairs.append(a)
+
+        # Second pass: link resulting trees, right to left
+        if len(pairs) == 0:
+            return None
+        root = pairs.pop()
+        while len(pairs)>0:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _find_owner(self, loc):
+        '''
+            Return the heap owning locator loc,
+            following the cells of melded heaps
+            (and compressing the followed path).
+        '''
+        cell = loc._owner
+        path = []
+        while isinstance(cell[0], list):
+            path.append(cell)
+            cell = cell[0]
+        for c in path:
+            c[0] = cell
+        loc._owner = cell
+        return cell[0]
+
+    def _validate(self, loc):
+        '''
+            Raises an error if loc is not a
+            valid locator of the current heap.
+        '''
+        if not isinstance(loc, self.Locator):
+            raise TypeError("loc must be a Locator object")
+        # Convention for deprecated nodes
+        if loc._prev is loc or self._find_owner(loc) is not self:
+            raise ValueError("Invalid locator")
+
+    #---------- Public methods ----------
+    def __len__(self):
+        '''
+            Return number of elements stored in the priority queue
+        '''
+        return self._size
+
+    def min(self):
+        '''
+            Return (key, value) tuple corresonding to minimal element
+            of the priority queue.
+            Raises ValueError if the queue is empty.
+        '''
+        if self.is_empty():
+            raise ValueError("Cannot return min element of an empty priority queue")
+        return (self._root._key, self._root._value)
+
+    def add(self, k, v):
+        '''
+            Add key-value item (k,v) to the priority queue,
+            and return a locator for the new entry.
+        '''
+        token = self.Locator(k,v,self._owner)
+        if self._root is None:
+            self._root = token
+        else:
+            self._root = self._link(self._root, token)
+        self._size += 1
+        return token
+
+    def remove_min(self):
+        '''
+            Remove and return minimal element of the priority
+            queue, and merge the subtrees of the root.
+            Raises ValueError if the queue is empty.
+        '''
+        if self.is_empty():
+            raise ValueError("Cannot remove minimal element of an empty priority queue")
+        old_root = self._root
+        self._root = self._merge_pairs(old_root._child)
+        self._size -= 1
+
+        # Deprecate removed node
+        old_root._child = None
+        old_root._prev = old_root
+        return (old_root._key, old_root._value)
+
+    def update(self, loc, k, v):
+        '''
+            Update the key and value of the entry
+            identified by locator loc.
+            Decreasing the key takes O(1) time,
+            increasing it amortized O(log n) time.
+            Raises ValueError if loc is invalid.
+        '''
+        self._validate(loc)
+        old_key = loc._key
+        loc._key = k
+        loc._value = v
+
+        # Decrease-key: cut subtree of loc and link it to the root
+        if k<old_key:
+            if loc is not self._root:
+                self._detach(loc)
+                self._root = self._link(self._root, loc)
+
+        # Increase-key: children of loc may now violate heap-order
+        elif loc._child is not None:
+            sub = self._merge_pairs(loc._child)
+            loc._child = None
+            self._root = self._link(self._root, sub)
+
+    def remove(self, loc):
+        '''
+            Remove and return the (k,v) pair
+            identified by locator loc.
+            Raises ValueError if loc is invalid.
+        '''
+        self._validate(loc)
+        if loc is self._root:
+            return self.remove_min()
+
+        self._detach(loc)
+        sub = self._merge_pairs(loc._child)
+        if sub is not None:
+            self._root = self._link(self._root, sub)
+        self._size -= 1
+
+        # Deprecate removed node
+        loc._child = None
+        loc._prev = loc
+        return (loc._key, loc._value)
+
+    def meld(self, other):
+        '''
+            Move all the entries of the pairing heap
+            other into the current one in O(1) time.
+            other is left empty, and its locators
+            remain valid for the current queue.
+            Raises TypeError if other is not a
+            PairingHeapPriorityQ.
+        '''
+        if not isinstance(other, PairingHeapPriorityQ):
+            raise TypeError("Can only meld with another PairingHeapPriorityQ")
+        if other is self or other._root is None:
+            return
+        if self._root is None:
+            self._root = other._root
+        else:
+            self._root = self._link(self._root, other._root)
+        self._size += other._size
+        other._root = None
+        other._size = 0
+        # Locators of other now resolve to the current heap
+        other._owner[0] = self._owner
+        other._owner = [other]
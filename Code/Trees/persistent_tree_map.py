@@ -0,0 +1,232 @@
+from .binary_search_tree_ajz import MapBase
+
+class PersistentTreeMap(MapBase):
+    '''
+        Implementation of a persistent map as an
+        AVL tree with path copying.
+        Nodes are never modified once created:
+        each write copies the O(log n) nodes on the
+        path from the root to the updated node, and
+        shares all other nodes with older versions.
+        Hence:
+        - snapshot() returns an independent map
+          sharing the current tree, in O(1) time,
+        - a snapshot is not affected by later writes,
+          and readers need no lock, since a write only
+          swaps the root reference of the written map,
+        - versions no longer referenced are
+          garbage-collected.
+        Unlike BSTMap, nodes have no parent link
+        (a node may belong to several versions), so
+        ordered iteration uses an explicit stack and
+        no Position objects are exposed.
+    '''
+    #---------- Nested _Node class ----------
+    class _Node(object):
+        '''
+            Immutable node of the persistent AVL tree.
+        '''
+        __slots__ = '_key', '_value', '_left', '_right', '_height'
+
+        def __init__(self, key, value, left, right, height):
+            self._key = key
+            self._value = value
+            self._left = left
+            self._right = right
+            self._height = height
+
+    #---------- Constructor ----------
+    def __init__(self, contents=()):
+        '''
+            Constructor for the map.
+            contents is an optional iterable
+            of (key, value) pairs.
+        '''
+        self._root = None
+        self._size = 0
+        for k, v in contents:
+            self[k] = v
+
+    #---------- Private path copying methods ----------
+    @staticmethod
+    def _height(node):
+        return node._height if node is not None else 0
+
+    def _make(self, key, value, left, right):
+        '''
+            Return a new node with the given fields.
+        '''
+        return self._Node(key, value, left, right, 1+max(self._height(left), self._height(right)))
+
+    def _balance(self, key, value, left, right):
+        '''
+            Return a new AVL-balanced node with the given
+            fields, where the heights of left and right
+            differ by at most 2. Rotations create new nodes.
+        '''
+        hl, hr = self._height(left), self._height(right)
+        if hl>hr+1:
+            # Single right rotation
+            if self._height(left._left)>=self._height(left._right):
+                return self._make(left._key, left._value, left._left,
+                                  self._make(key, value, left._right, right))
+            # Double rotation
+            lr = left._right
+            return self._make(lr._key, lr._value,
+                              self._make(left._key, left._value, left._left, lr._left),
+                              self._make(key, value, lr._right, right))
+        if hr>hl+1:
+            # Single left rotation
+            if self._height(right._right)>=self._height(right._left):
+                return self._make(right._key, right._value,
+                                  self._make(key, value, left, right._left), right._right)
+            # Double rotation
+            rl = right._left
+            return self._make(rl._key, rl._value,
+                              self._make(key, value, left, rl._left),
+                              self._make(right._key, right._value, rl._right, right._right))
+        return self._make(key, value, left, right)
+
+    def _insert(self, node, k, v):
+        '''
+            Return (new root, added) after assigning v to k
+            in the subtree rooted at node, where added is
+            True if k was not in the subtree.
+        '''
+        if node is None:
+            return self._Node(k, v, None, None, 1), True
+        if k<node._key:
+            left, added = self._insert(node._left, k, v)
+            return self._balance(node._key, node._value, left, node._right), added
+        elif node._key<k:
+            right, added = self._insert(node._right, k, v)
+            return self._balance(node._key, node._value, node._left, right), added
+        else:
+            return self._Node(node._key, v, node._left, node._right, node._height), False
+
+    def _remove_first(self, node):
+        '''
+            Return (first node, new root) after removing
+            the node with lowest key from the subtree.
+        '''
+        if node._left is None:
+            return node, node._right
+        first, left = self._remove_first(node._left)
+        return first, self._balance(node._key, node._value, left, node._right)
+
+    def _remove(self, node, k):
+        '''
+            Return new root after removing key k from
+            the subtree rooted at node.
+            Raises ValueError if k is not found.
+        '''
+        if node is None:
+            raise ValueError(f"Key \'{repr(k)}\' not found")
+        if k<node._key:
+            return self._balance(node._key, node._value, self._remove(node._left, k), node._right)
+        elif node._key<k:
+            return self._balance(node._key, node._value, node._left, self._remove(node._right, k))
+        if node._left is None:
+            return node._right
+        if node._right is None:
+            return node._left
+        # Replace by successor
+        succ, right = self._remove_first(node._right)
+        return self._balance(succ._key, succ._value, node._left, right)
+
+    def _search(self, k):
+        '''
+            Return node with key k (None if not found).
+        '''
+        node = self._root
+        while node is not None:
+            if k<node._key:
+                node = node._left
+            elif node._key<k:
+                node = node._right
+            else:
+                return node
+        return None
+
+    #---------- Public Map methods ----------
+    def __len__(self):
+        '''
+            Return number of items in the map.
+        '''
+        return self._size
+
+    def __getitem__(self, k):
+        '''
+            Search for key k in map and
+            return associated value.
+            Implements the call M[k]
+        '''
+        if self._root is None:
+            raise ValueError("Map is empty")
+        node = self._search(k)
+        if node is None:
+            raise ValueError(f"Key \'{repr(k)}\' not found")
+        return node._value
+
+    def __setitem__(self, k, v):
+        '''
+            Assign value v to key k, copying
+            the nodes on the search path.
+        '''
+        root, added = self._insert(self._root, k, v)
+        self._root = root
+        if added:
+            self._size += 1
+
+    def __delitem__(self, k):
+        '''
+            Delete item with key k from map,
+            copying the nodes on the search path.
+        '''
+        if self._root is None:
+            raise ValueError("Map is empty.")
+        self._root = self._remove(self._root, k)
+        self._size -= 1
+
+    def __iter__(self):
+        '''
+            Generate iterator over all keys in increasing order.
+            The iteration runs over the version of the map
+            at the time of the call.
+        '''
+        stack = []
+        node = self._root
+        while len(stack)>0 or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node._left
+            node = stack.pop()
+            yield node._key
+            node = node._right
+
+    def __reversed__(self):
+        '''
+            Generate iterator over all keys in decreasing order.
+        '''
+        stack = []
+        node = self._root
+        while len(stack)>0 or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node._right
+            node = stack.pop()
+            yield node._key
+            node = node._left
+
+    #---------- Public snapshot methods ----------
+    def snapshot(self):
+        '''
+            Return a new PersistentTreeMap holding the
+            current version of the map, in O(1) time.
+            Both maps can be read and written
+            independently afterwards.
+        '''
+        M = type(self)()
+        M._root = self._root
+        M._size = self._size
+        return M
@@ -0,0 +1,118 @@
+from .heap_priority_queue import PriorityQueueBase
+
+class RadixHeapPriorityQ(PriorityQueueBase):
+    '''
+        Implementation of a monotone priority
+        queue for non-negative integer keys, as
+        a radix heap.
+        Keys added must not be lower than the
+        last minimal key returned by min() or
+        remove_min() (as in Dijkstra's algorithm
+        or timer queues).
+        An item with key k is stored in bucket
+        (k XOR last).bit_length(), where last is
+        the last minimal key. When bucket 0 is
+        empty, the first non-empty bucket is
+        redistributed into lower buckets, and each
+        item moves down at most log C times, where
+        C is the largest key. No key comparisons
+        between items are done outside of these
+        redistributions.
+    '''
+    #---------- Constructor ----------
+    def __init__(self, contents=()):
+        '''
+            Constructor for priority queue.
+            contents is an optional iterable of
+            (key, value) pairs.
+        '''
+        self._last = 0
+        self._size = 0
+        self._buckets = [[]]
+        for k, v in contents:
+            self.add(k,v)
+
+    #---------- Private methods ----------
+    def _push(self, k, v):
+        '''
+            Place item (k,v) in the bucket
+            corresponding to its key.
+        '''
+        b = (k^self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets)<=b:
+            buckets.append([])
+        buckets[b].append((k,v))
+
+    def _refill(self):
+        '''
+            Ensure that bucket 0 holds the items
+            with minimal key. Assumes queue is non-empty.
+        '''
+        buckets = self._buckets
+        if len(buckets[0])>0:
+            return
+
+        # First non-empty bucket
+        i = 1
+        while len(buckets[i])==0:
+            i += 1
+
+        # New last key is the minimal key of bucket i
+        bucket = buckets[i]
+        buckets[i] = []
+        self._last = min(k for k, _ in bucket)
+
+        # Redistribute items of bucket i into lower buckets
+        for k, v in bucket:
+            buckets[(k^self._last).bit_length()].append((k,v))
+
+    #---------- Public methods ----------
+    def __len__(self):
+        '''
+            Return number of elements stored in the priority queue
+        '''
+        return self._size
+
+    def last_key(self):
+        '''
+            Return the lowest key that may still be
+            added (the last minimal key found).
+        '''
+        return self._last
+
+    def add(self, k, v):
+        '''
+            Add key-value item (k,v) to the priority queue.
+            Raises TypeError if k is not an integer, and
+            ValueError if k is lower than the last minimal key.
+        '''
+        if not isinstance(k, int):
+            raise TypeError("Keys of a radix heap must be integers")
+        if k<self._last:
+            raise ValueError(f"Key {k} is lower than last minimal key {self._last}")
+        self._push(k,v)
+        self._size += 1
+
+    def min(self):
+        '''
+            Return (key, value) tuple corresonding to minimal element
+            of the priority queue.
+            Raises ValueError if the queue is empty.
+        '''
+        if self.is_empty():
+            raise ValueError("Cannot return min element of an empty priority queue")
+        self._refill()
+        return self._buckets[0][-1]
+
+    def remove_min(self):
+        '''
+            Remove and return minimal element of the priority
+            queue.
+            Raises ValueError if the queue is empty.
+        '''
+        if self.is_empty():
+            raise ValueError("Cannot remove minimal element of an empty priority queue")
+        self._refill()
+        self._size -= 1
+        return self._buckets[0].pop()
@@ -0,0 +1,209 @@
+from .binary_search_tree_ajz import BSTMap
+
+# Based on: https://github.com/mjwestcott/Goodrich/blob/master/ch11/red_black_tree.py
+class RedBlackTreeMap(BSTMap):
+    '''
+        Implementation of a map as a red-black tree.
+        Each node stores a color bit, such that:
+        - the root is black,
+        - a red node has no red child,
+        - all paths from a node to a missing child
+          go through the same number of black nodes.
+        The tree height is thus O(log n), and each
+        update performs at most O(1) rotations
+        (the other fixes are recolorings).
+    '''
+    #---------- Nested _Node class ----------
+    class _Node(BSTMap._Node):
+        '''
+            Node class with a color attribute.
+            (New nodes are red)
+        '''
+        __slots__ = '_red'
+
+        def __init__(self, element, parent=None, left=None, right=None):
+            super().__init__(element, parent, left, right)
+            self._red = True
+
+    #---------- Private color methods ----------
+    def _set_red(self, p):
+        p._node._red = True
+
+    def _set_black(self, p):
+        p._node._red = False
+
+    def _set_color(self, p, make_red):
+        p._node._red = make_red
+
+    def _is_red(self, p):
+        '''
+            Return True if p is a red position.
+            (Missing children are black)
+        '''
+        return p is not None and p._node._red
+
+    def _is_red_leaf(self, p):
+        return self._is_red(p) and self.is_leaf(p)
+
+    def _get_red_child(self, p):
+        '''
+            Return a red child of p (None if there is none).
+        '''
+        for child in (self.left(p), self.right(p)):
+            if self._is_red(child):
+                return child
+        return None
+
+    #---------- Private insertion methods ----------
+    def _resolve_red(self, p):
+        '''
+            Fix a double red at position p.
+            Either restructure once (black uncle)
+            or recolor and move up (red uncle).
+        '''
+        while True:
+            if self.is_root(p):
+                self._set_black(p)
+                return
+            parent = self.parent(p)
+            if not self._is_red(parent):
+                return
+            uncle = self.sibling(parent)
+            # Case 1: black uncle, trinode restructuring
+            if not self._is_red(uncle):
+                middle = self._trinode_restructure(p)
+                self._set_black(middle)
+                self._set_red(self.left(middle))
+                self._set_red(self.right(middle))
+                return
+            # Case 2: red uncle, recoloring may propagate
+            grand = self.parent(parent)
+            self._set_red(grand)
+            self._set_black(self.left(grand))
+            self._set_black(self.right(grand))
+            p = grand
+
+    #---------- Private deletion methods ----------
+    def _fix_deficit(self, z, y):
+        '''
+            Resolve black deficit at z, where y is the
+            root of the heavier subtree of z.
+        '''
+        while True:
+            if not self._is_red(y):
+                x = self._get_red_child(y)
+                # Case 1: black y with a red child, restructure
+                if x is not None:
+                    old_color = self._is_red(z)
+                    middle = self._trinode_restructure(x)
+                    self._set_color(middle, old_color)
+                    self._set_black(self.left(middle))
+                    self._set_black(self.right(middle))
+                    return
+                # Case 2: black y with black children, recolor
+                self._set_red(y)
+                if self._is_red(z):
+                    self._set_black(z)
+                    return
+                if self.is_root(z):
+                    return
+                # Deficit propagates upward
+                z, y = self.parent(z), self.sibling(z)
+            # Case 3: red y, rotate then retry with black sibling
+            else:
+                self._rotate(y)
+                self._set_black(y)
+                self._set_red(z)
+                if z == self.right(y):
+                    y = self.left(z)
+                else:
+                    y = self.right(z)
+
+    #---------- Private node-level join methods ----------
+    @staticmethod
+    def _black_height(node):
+        '''
+            Return number of black nodes on a path
+            from node to a missing child.
+        '''
+        h = 0
+        while node is not None:
+            if not node._red:
+                h += 1
+            node = node._left
+        return h
+
+    def _join_nodes(self, left, mid, right):
+        '''
+            Red-black join of detached subtrees left and
+            right with node mid: attach mid as a red node
+            on the spine of the taller subtree, at the
+            black height of the other one, then fix the
+            double red as after an insertion.
+        '''
+        # Red roots are recolored black, so that mid never gets a red child
+        for root in (left, right):
+            if root is not None:
+                root._red = False
+        bl, br = self._black_height(left), self._black_height(right)
+        mid._parent = None
+        if bl == br:
+            self._relink(mid, left, True)
+            self._relink(mid, right, False)
+            mid._red = False
+            return mid
+
+        taller, go_right = (left, True) if bl>br else (right, False)
+        target = min(bl, br)
+
+        # Descend the spine down to a black node (or None) of black height target
+        parent, c, h = None, taller, max(bl, br)
+        while c is not None and (c._red or h>target):
+            if not c._red:
+                h -= 1
+            parent = c
+            c = c._right if go_right else c._left
+
+        mid._red = True
+        if go_right:
+            self._relink(mid, c, True)
+            self._relink(mid, right, False)
+        else:
+            self._relink(mid, left, True)
+            self._relink(mid, c, False)
+        self._relink(parent, mid, not go_right)
+
+        # Fix double red inside a temporary tree rooted at taller
+        tmp = type(self)()
+        tmp._root = taller
+        tmp._resolve_red(tmp._make_position(mid))
+        return tmp._root
+
+    def _finalize_root(self):
+        if self._root is not None:
+            self._root._red = False
+
+    #---------- Rebalancing hooks ----------
+    def _init_bulk_node(self, node, depth, max_depth):
+        # Only the deepest level of a bulk-built tree is red
+        node._red = (depth == max_depth and depth>0)
+
+    def _rebalance_insert(self, p):
+        self._resolve_red(p)
+
+    def _rebalance_delete(self, p):
+        if len(self) == 1:
+            self._set_black(self.root())
+        elif p is not None:
+            n = self.num_children(p)
+            if n == 1:
+                # Black deficit if the remaining child is not a red leaf
+                c = next(self.children(p))
+                if not self._is_red_leaf(c):
+                    self._fix_deficit(p, c)
+            elif n == 2:
+                # Removed node was black with a red child, which moved up
+                if self._is_red_leaf(self.left(p)):
+                    self._set_black(self.left(p))
+                elif self._is_red_leaf(self.right(p)):
+                    self._set_black(self.right(p))
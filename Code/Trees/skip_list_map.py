@@ -0,0 +1,378 @@
+from random import Random
+from .binary_search_tree_ajz import MapBase
+
+class SkipListMap(MapBase):
+    '''
+        Implementation of a sorted map as a skip list.
+        Nodes are linked in key order at level 0, and
+        each node also belongs to levels 1..h-1, where
+        h is drawn at random with P(h>i) = 1/2^i.
+        A search starts at the highest level and drops
+        one level each time the next key is too large,
+        so searches and updates take O(log n) expected
+        time, without any rotation: an update only
+        relinks the neighbours of one node.
+        Nodes also keep a link to their predecessor,
+        for before() and reversed iteration.
+    '''
+    MAX_LEVEL = 32
+
+    #---------- Nested _Node class ----------
+    class _Node(object):
+        '''
+            Skip list node, with one forward link
+            per level in _next.
+        '''
+        __slots__ = '_key', '_value', '_next', '_prev'
+
+        def __init__(self, key, value, height):
+            self._key = key
+            self._value = value
+            self._next = [None]*height
+            self._prev = None
+
+    #---------- Nested Position class ----------
+    class Position(object):
+        '''
+            Position of an item of a SkipListMap.
+        '''
+        __slots__ = '_container', '_node'
+
+        def __init__(self, container, node):
+            '''
+                Constructor should not be invoked by user.
+            '''
+            self._container = container
+            self._node = node
+
+        def key(self):
+            '''
+                Return key of item at current position
+            '''
+            return self._node._key
+
+        def value(self):
+            '''
+                Return value of item at current position
+            '''
+            return self._node._value
+
+        def __eq__(self, other):
+            return type(other) is type(self) and other._node is self._node
+
+        def __ne__(self, other):
+            return not (self == other)
+
+    #---------- Constructor ----------
+    def __init__(self, contents=(), seed=None):
+        '''
+            Constructor for the map.
+            contents is an optional iterable
+            of (key, value) pairs.
+            seed initializes the random generator
+            used to draw node heights.
+        '''
+        # Header node: its forward links are the heads of each level
+        self._head = self._Node(None, None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._rng = Random(seed)
+        for k, v in contents:
+            self[k] = v
+
+    #---------- Private skip list methods ----------
+    def _random_height(self):
+        '''
+            Return a random height h>=1,
+            with P(h>i) = 1/2^i.
+        '''
+        bits = self._rng.getrandbits(self.MAX_LEVEL-1)
+        h = 1
+        while bits&1:
+            h += 1
+            bits >>= 1
+        return h
+
+    def _find_preds(self, k):
+        '''
+            Return list of the last node with key < k
+            at each level (the header if there is none).
+        '''
+        preds = [self._head]*self.MAX_LEVEL
+        node = self._head
+        for level in range(self._level-1, -1, -1):
+            nxt = node._next[level]
+            while nxt is not None and nxt._key<k:
+                node = nxt
+                nxt = node._next[level]
+            preds[level] = node
+        return preds
+
+    def _find_lt_node(self, k):
+        '''
+            Return last node with key < k
+            (the header if there is none).
+        '''
+        node = self._head
+        for level in range(self._level-1, -1, -1):
+            nxt = node._next[level]
+            while nxt is not None and nxt._key<k:
+                node = nxt
+                nxt = node._next[level]
+        return node
+
+    def _find_le_node(self, k):
+        '''
+            Return last node with key <= k
+            (the header if there is none).
+        '''
+        node = self._head
+        for level in range(self._level-1, -1, -1):
+            nxt = node._next[level]
+            while nxt is not None and not k<nxt._key:
+                node = nxt
+                nxt = node._next[level]
+        return node
+
+    def _find_last_node(self):
+        '''
+            Return node with greatest key
+            (the header if the map is empty).
+        '''
+        node = self._head
+        for level in range(self._level-1, -1, -1):
+            while node._next[level] is not None:
+                node = node._next[level]
+        return node
+
+    def _validate(self, p):
+        '''
+            Return node of position p.
+        '''
+        if not isinstance(p, self.Position):
+            raise TypeError('p must be proper Position type')
+        if p._container is not self:
+            raise ValueError('p does not belong to this container')
+        if p._node._next is None:      # convention for deleted nodes
+            raise ValueError('p is no longer valid')
+        return p._node
+
+    def _make_position(self, node):
+        '''
+            Return Position of node (None if node
+            is None or is the header).
+        '''
+        if node is None or node is self._head:
+            return None
+        return self.Position(self, node)
+
+    #---------- Public Map methods ----------
+    def __len__(self):
+        '''
+            Return number of items in the map.
+        '''
+        return self._size
+
+    def __getitem__(self, k):
+        '''
+            Search for key k in map and
+            return associated value.
+            Implements the call M[k]
+        '''
+        if self._size == 0:
+            raise ValueError("Map is empty")
+        node = self._find_lt_node(k)._next[0]
+        if node is None or k<node._key:
+            raise ValueError(f"Key \'{repr(k)}\' not found")
+        return node._value
+
+    def __contains__(self, k):
+        node = self._find_lt_node(k)._next[0]
+        return node is not None and not k<node._key
+
+    def __setitem__(self, k, v):
+        '''
+            Assign value v to key k.
+        '''
+        preds = self._find_preds(k)
+        node = preds[0]._next[0]
+        if node is not None and not k<node._key:
+            node._value = v
+            return
+        h = self._random_height()
+        if h>self._level:
+            self._level = h
+        new = self._Node(k, v, h)
+        for level in range(h):
+            new._next[level] = preds[level]._next[level]
+            preds[level]._next[level] = new
+        new._prev = preds[0]
+        if new._next[0] is not None:
+            new._next[0]._prev = new
+        self._size += 1
+
+    def _unlink(self, node, preds):
+        '''
+            Unlink node, given the list of the
+            last nodes before it at each level.
+        '''
+        for level in range(len(node._next)):
+            preds[level]._next[level] = node._next[level]
+        if node._next[0] is not None:
+            node._next[0]._prev = node._prev
+        while self._level>1 and self._head._next[self._level-1] is None:
+            self._level -= 1
+        self._size -= 1
+        # Deprecate node
+        node._next = None
+        node._prev = None
+
+    def delete(self, p):
+        '''
+            Delete item at position p.
+        '''
+        node = self._validate(p)
+        self._unlink(node, self._find_preds(node._key))
+
+    def __delitem__(self, k):
+        '''
+            Delete item with key k from map.
+        '''
+        if self._size == 0:
+            raise ValueError("Map is empty.")
+        preds = self._find_preds(k)
+        node = preds[0]._next[0]
+        if node is None or k<node._key:
+            raise ValueError(f"Key \'{repr(k)}\' not found")
+        self._unlink(node, preds)
+
+    def __iter__(self):
+        '''
+            Generate iterator over all keys in increasing order.
+        '''
+        node = self._head._next[0]
+        while node is not None:
+            yield node._key
+            node = node._next[0]
+
+    def __reversed__(self):
+        '''
+            Generate iterator over all keys in decreasing order.
+        '''
+        node = self._find_last_node()
+        while node is not self._head:
+            yield node._key
+            node = node._prev
+
+    #---------- Public navigation methods ----------
+    def first(self):
+        '''
+            Return first Position in map
+            (i.e. position of lowest key)
+        '''
+        return self._make_position(self._head._next[0])
+
+    def last(self):
+        '''
+            Return last Position in map
+            (i.e. position of greatest key)
+        '''
+        return self._make_position(self._find_last_node())
+
+    def before(self, p):
+        '''
+            Return Position just before p
+            in key order.
+            (None if p.key() is lowest)
+        '''
+        node = self._validate(p)
+        return self._make_position(node._prev)
+
+    def after(self, p):
+        '''
+            Return Position right after p
+            in key order.
+            (None if p.key() is greatest)
+        '''
+        node = self._validate(p)
+        return self._make_position(node._next[0])
+
+    #---------- Public ordered search methods ----------
+    def find_ge(self, k):
+        '''
+            Return Position of least key greater
+            than or equal to k (None if no such key).
+        '''
+        return self._make_position(self._find_lt_node(k)._next[0])
+
+    def find_gt(self, k):
+        '''
+            Return Position of least key strictly
+            greater than k (None if no such key).
+        '''
+        return self._make_position(self._find_le_node(k)._next[0])
+
+    def find_le(self, k):
+        '''
+            Return Position of greatest key less
+            than or equal to k (None if no such key).
+        '''
+        return self._make_position(self._find_le_node(k))
+
+    def find_lt(self, k):
+        '''
+            Return Position of greatest key strictly
+            less than k (None if no such key).
+        '''
+        return self._make_position(self._find_lt_node(k))
+
+    def find_range(self, start, stop):
+        '''
+            Generate (key, value) pairs with
+            start <= key < stop, in increasing
+            key order. If start (resp. stop) is None,
+            iteration begins with the lowest key
+            (resp. continues to the greatest key).
+            Runs in O(log n+s) expected time for
+            s reported items.
+        '''
+        if start is None:
+            node = self._head._next[0]
+        else:
+            node = self._find_lt_node(start)._next[0]
+        while node is not None and (stop is None or node._key<stop):
+            yield (node._key, node._value)
+            node = node._next[0]
+
+    #---------- Public bulk loading methods ----------
+    @classmethod
+    def from_sorted(cls, items, seed=None):
+        '''
+            Return a new map built in O(n) time from
+            the iterable items of (key, value) pairs,
+            sorted by strictly increasing keys.
+            Heights are assigned deterministically:
+            the i-th node (from 1) has height 1 plus
+            the number of trailing zero bits of i, as
+            in a perfectly balanced skip list.
+            Raises ValueError if items are not sorted.
+        '''
+        M = cls(seed=seed)
+        # Last node linked at each level
+        tails = [M._head]*cls.MAX_LEVEL
+        prev = M._head
+        i = 0
+        for k, v in items:
+            if prev is not M._head and not prev._key<k:
+                raise ValueError(f"Keys must be strictly increasing: {repr(k)} after {repr(prev._key)}")
+            i += 1
+            h = min((i&-i).bit_length(), cls.MAX_LEVEL)
+            node = cls._Node(k, v, h)
+            for level in range(h):
+                tails[level]._next[level] = node
+                tails[level] = node
+            node._prev = prev
+            prev = node
+            M._level = max(M._level, h)
+        M._size = i
+        return M
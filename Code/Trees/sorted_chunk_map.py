@@ -0,0 +1,380 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from .binary_search_tree_ajz import MapBase
+
+class SortedChunkMap(MapBase):
+    '''
+        Implementation of a sorted map as a list of
+        sorted chunks, like the leaves of a B+-tree:
+        - _keys[i] and _values[i] are parallel lists
+          holding the items of chunk i, sorted by key,
+        - _maxes[i] is the greatest key of chunk i,
+          so the chunk of a key is found by bisection
+          of _maxes, and its offset by bisection of
+          the chunk.
+        Chunks hold between chunk_size//2 and
+        2*chunk_size items (except a single chunk),
+        so updates shift O(chunk_size) references and
+        searches cost O(log n).
+        Keys and values are stored directly in lists
+        (no node or _Item object per entry), which uses
+        about 20 bytes per entry on CPython, and ordered
+        iteration runs over contiguous lists.
+    '''
+    #---------- Nested Position class ----------
+    class Position(object):
+        '''
+            Position of an item of a SortedChunkMap,
+            given by its chunk index and offset.
+            After an insertion or a deletion in the map,
+            the position is located again from its key.
+        '''
+        __slots__ = '_container', '_i', '_j', '_key', '_version'
+
+        def __init__(self, container, i, j):
+            '''
+                Constructor should not be invoked by user.
+            '''
+            self._container = container
+            self._i = i
+            self._j = j
+            self._key = container._keys[i][j]
+            self._version = container._version
+
+        def key(self):
+            '''
+                Return key of item at current position
+            '''
+            return self._key
+
+        def value(self):
+            '''
+                Return value of item at current position
+            '''
+            i, j = self._container._validate(self)
+            return self._container._values[i][j]
+
+        def __eq__(self, other):
+            return (type(other) is type(self) and other._container is self._container
+                    and other._key == self._key)
+
+        def __ne__(self, other):
+            return not (self == other)
+
+    #---------- Constructor ----------
+    def __init__(self, contents=(), chunk_size=256):
+        '''
+            Constructor for the map.
+            contents is an optional iterable
+            of (key, value) pairs.
+            chunk_size is the typical number of items
+            per chunk. Raises ValueError if chunk_size<4.
+        '''
+        if chunk_size<4:
+            raise ValueError(f"Chunk size must be at least 4, got {chunk_size}")
+        self._chunk_size = chunk_size
+        self._keys = []
+        self._values = []
+        self._maxes = []
+        self._size = 0
+        self._version = 0
+        for k, v in contents:
+            self[k] = v
+
+    #---------- Private chunk methods ----------
+    def _locate(self, k):
+        '''
+            Return (i, j) such that _keys[i][j] is the
+            least key >= k, or (len(_keys), 0) if there
+            is no such key.
+        '''
+        i = bisect_left(self._maxes, k)
+        if i == len(self._maxes):
+            return i, 0
+        return i, bisect_left(self._keys[i], k)
+
+    def _split_chunk(self, i):
+        '''
+            Split chunk i in two halves.
+        '''
+        keys, values = self._keys[i], self._values[i]
+        half = len(keys)//2
+        self._keys[i+1:i+1] = [keys[half:]]
+        self._values[i+1:i+1] = [values[half:]]
+        del keys[half:]
+        del values[half:]
+        self._maxes.insert(i, keys[-1])
+
+    def _fix_small_chunk(self, i):
+        '''
+            Merge chunk i, with less than chunk_size//2
+            items, with a neighbour chunk (and split the
+            result if it is too large). Remove chunk i
+            if it is empty.
+        '''
+        if len(self._keys[i]) == 0:
+            del self._keys[i], self._values[i], self._maxes[i]
+            return
+        if len(self._keys) == 1:
+            return
+        # Merge chunk i into chunk i-1, or chunk i+1 into chunk i
+        if i>0:
+            i -= 1
+        self._keys[i].extend(self._keys[i+1])
+        self._values[i].extend(self._values[i+1])
+        self._maxes[i] = self._maxes[i+1]
+        del self._keys[i+1], self._values[i+1], self._maxes[i+1]
+        if len(self._keys[i])>2*self._chunk_size:
+            self._split_chunk(i)
+
+    def _validate(self, p):
+        '''
+            Return (i, j) indices of position p.
+            Raises ValueError if the key of p
+            is no longer in the map.
+        '''
+        if not isinstance(p, self.Position):
+            raise TypeError('p must be proper Position type')
+        if p._container is not self:
+            raise ValueError('p does not belong to this container')
+        if p._version != self._version:
+            i, j = self._locate(p._key)
+            if i == len(self._keys) or p._key<self._keys[i][j]:
+                raise ValueError('p is no longer valid')
+            p._i, p._j, p._version = i, j, self._version
+        return p._i, p._j
+
+    def _make_position(self, i, j):
+        '''
+            Return Position of item (i, j), or None
+            if (i, j) is out of the map.
+        '''
+        if j<0:
+            i -= 1
+            if i<0:
+                return None
+            j = len(self._keys[i])-1
+        elif i<len(self._keys) and j == len(self._keys[i]):
+            i, j = i+1, 0
+        if i>=len(self._keys):
+            return None
+        return self.Position(self, i, j)
+
+    #---------- Public Map methods ----------
+    def __len__(self):
+        '''
+            Return number of items in the map.
+        '''
+        return self._size
+
+    def __getitem__(self, k):
+        '''
+            Search for key k in map and
+            return associated value.
+            Implements the call M[k]
+        '''
+        if self._size == 0:
+            raise ValueError("Map is empty")
+        i = bisect_left(self._maxes, k)
+        if i<len(self._maxes):
+            keys = self._keys[i]
+            j = bisect_left(keys, k)
+            if not k<keys[j]:
+                return self._values[i][j]
+        raise ValueError(f"Key \'{repr(k)}\' not found")
+
+    def __contains__(self, k):
+        i, j = self._locate(k)
+        return i<len(self._keys) and not k<self._keys[i][j]
+
+    def __setitem__(self, k, v):
+        '''
+            Assign value v to key k.
+        '''
+        if self._size == 0:
+            self._keys.append([k])
+            self._values.append([v])
+            self._maxes.append(k)
+        else:
+            i, j = self._locate(k)
+            if i == len(self._keys):
+                # k is greater than all keys: append to last chunk
+                i -= 1
+                j = len(self._keys[i])
+                self._maxes[i] = k
+            elif not k<self._keys[i][j]:
+                self._values[i][j] = v
+                return
+            self._keys[i].insert(j, k)
+            self._values[i].insert(j, v)
+            if len(self._keys[i])>2*self._chunk_size:
+                self._split_chunk(i)
+        self._size += 1
+        self._version += 1
+
+    def delete(self, p):
+        '''
+            Delete item at position p.
+        '''
+        i, j = self._validate(p)
+        keys = self._keys[i]
+        del keys[j]
+        del self._values[i][j]
+        self._size -= 1
+        self._version += 1
+        if len(keys)>0:
+            self._maxes[i] = keys[-1]
+        if len(keys)<self._chunk_size//2:
+            self._fix_small_chunk(i)
+
+    def __delitem__(self, k):
+        '''
+            Delete item with key k from map.
+        '''
+        if self._size == 0:
+            raise ValueError("Map is empty.")
+        i, j = self._locate(k)
+        if i == len(self._keys) or k<self._keys[i][j]:
+            raise ValueError(f"Key \'{repr(k)}\' not found")
+        self.delete(self.Position(self, i, j))
+
+    def __iter__(self):
+        '''
+            Generate iterator over all keys in increasing order.
+        '''
+        return chain.from_iterable(self._keys)
+
+    def __reversed__(self):
+        '''
+            Generate iterator over all keys in decreasing order.
+        '''
+        for keys in reversed(self._keys):
+            yield from reversed(keys)
+
+    def clear(self):
+        '''
+            Remove all items from the map.
+        '''
+        self._keys, self._values, self._maxes = [], [], []
+        self._size = 0
+        self._version += 1
+
+    #---------- Public navigation methods ----------
+    def first(self):
+        '''
+            Return first Position in map
+            (i.e. position of lowest key)
+        '''
+        return self._make_position(0, 0)
+
+    def last(self):
+        '''
+            Return last Position in map
+            (i.e. position of greatest key)
+        '''
+        if self._size == 0:
+            return None
+        i = len(self._keys)-1
+        return self._make_position(i, len(self._keys[i])-1)
+
+    def before(self, p):
+        '''
+            Return Position just before p
+            in key order.
+            (None if p.key() is lowest)
+        '''
+        i, j = self._validate(p)
+        return self._make_position(i, j-1)
+
+    def after(self, p):
+        '''
+            Return Position right after p
+            in key order.
+            (None if p.key() is greatest)
+        '''
+        i, j = self._validate(p)
+        return self._make_position(i, j+1)
+
+    #---------- Public ordered search methods ----------
+    def find_ge(self, k):
+        '''
+            Return Position of least key greater
+            than or equal to k (None if no such key).
+        '''
+        return self._make_position(*self._locate(k))
+
+    def find_gt(self, k):
+        '''
+            Return Position of least key strictly
+            greater than k (None if no such key).
+        '''
+        i = bisect_right(self._maxes, k)
+        if i == len(self._maxes):
+            return None
+        return self._make_position(i, bisect_right(self._keys[i], k))
+
+    def find_le(self, k):
+        '''
+            Return Position of greatest key less
+            than or equal to k (None if no such key).
+        '''
+        i = bisect_right(self._maxes, k)
+        if i == len(self._maxes):
+            return self.last()
+        return self._make_position(i, bisect_right(self._keys[i], k)-1)
+
+    def find_lt(self, k):
+        '''
+            Return Position of greatest key strictly
+            less than k (None if no such key).
+        '''
+        i, j = self._locate(k)
+        if i == len(self._keys):
+            return self.last()
+        return self._make_position(i, j-1)
+
+    def find_range(self, start, stop):
+        '''
+            Generate (key, value) pairs with
+            start <= key < stop, in increasing
+            key order. If start (resp. stop) is None,
+            iteration begins with the lowest key
+            (resp. continues to the greatest key).
+            Runs in O(log n+s) time for s reported items.
+        '''
+        i, j = (0, 0) if start is None else self._locate(start)
+        while i<len(self._keys):
+            keys, values = self._keys[i], self._values[i]
+            # Last offset in range within chunk i
+            end = len(keys) if stop is None else bisect_left(keys, stop, j)
+            for t in range(j, end):
+                yield (keys[t], values[t])
+            if end<len(keys):
+                return
+            i, j = i+1, 0
+
+    #---------- Public bulk loading methods ----------
+    @classmethod
+    def from_sorted(cls, items, chunk_size=256):
+        '''
+            Return a new map built in O(n) time from
+            the iterable items of (key, value) pairs,
+            sorted by strictly increasing keys.
+            Raises ValueError if items are not sorted.
+        '''
+        M = cls(chunk_size=chunk_size)
+        keys, values = [], []
+        for k, v in items:
+            if len(keys)>0 and not keys[-1]<k:
+                raise ValueError(f"Keys must be strictly increasing: {repr(k)} after {repr(keys[-1])}")
+            keys.append(k)
+            values.append(v)
+        for lo in range(0, len(keys), chunk_size):
+            M._keys.append(keys[lo:lo+chunk_size])
+            M._values.append(values[lo:lo+chunk_size])
+            M._maxes.append(M._keys[-1][-1])
+        # The last chunk may be too small: merge it with its neighbour
+        if len(M._keys)>1 and len(M._keys[-1])<chunk_size//2:
+            M._fix_small_chunk(len(M._keys)-1)
+        M._size = len(keys)
+        return M
@@ -0,0 +1,43 @@
+from .binary_search_tree_ajz import BSTMap
+
+# Based on: https://github.com/mjwestcott/Goodrich/blob/master/ch11/splay_tree.py
+class SplayTreeMap(BSTMap):
+    '''
+        Implementation of a map as a splay tree.
+        Every accessed, inserted or deleted position
+        (or the last position visited by a failed
+        search) is splayed to the root, so frequently
+        accessed keys stay close to the root.
+        Operations run in amortized O(log n) time.
+    '''
+    #---------- Private splaying method ----------
+    def _splay(self, p):
+        '''
+            Move position p to the root with
+            zig, zig-zig and zig-zag rotations.
+        '''
+        while p._node is not self._root:
+            parent = self.parent(p)
+            grand = self.parent(parent)
+            # Zig: parent is the root
+            if grand is None:
+                self._rotate(p)
+            # Zig-zig: p and parent are aligned
+            elif (parent == self.left(grand)) == (p == self.left(parent)):
+                self._rotate(parent)
+                self._rotate(p)
+            # Zig-zag
+            else:
+                self._rotate(p)
+                self._rotate(p)
+
+    #---------- Rebalancing hooks ----------
+    def _rebalance_insert(self, p):
+        self._splay(p)
+
+    def _rebalance_delete(self, p):
+        if p is not None:
+            self._splay(p)
+
+    def _rebalance_access(self, p):
+        self._splay(p)
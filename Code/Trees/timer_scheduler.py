@@ -0,0 +1,285 @@
+from math import floor
+
+from .heap_priority_queue import HeapPriorityQ
+
+class TimerHandle(object):
+    '''
+        Handle on a timer scheduled in a
+        TimerWheelScheduler. Returned by
+        TimerWheelScheduler.schedule(), and
+        used to cancel the timer in O(1) time.
+    '''
+    __slots__ = '_deadline', '_tick', '_callback', '_scheduler', '_slot', '_level'
+
+    def __init__(self, deadline, tick, callback, scheduler):
+        '''
+            Constructor. Invoked only by TimerWheelScheduler.
+        '''
+        self._deadline = deadline
+        self._tick = tick
+        self._callback = callback
+        # None once the timer has fired or was cancelled
+        self._scheduler = scheduler
+        # Dictionary (wheel slot) holding the handle, None if in overflow heap
+        self._slot = None
+        self._level = None
+
+    def deadline(self):
+        '''
+            Return deadline of the timer.
+        '''
+        return self._deadline
+
+    def callback(self):
+        '''
+            Return callback of the timer.
+        '''
+        return self._callback
+
+    def active(self):
+        '''
+            Return True if the timer is still pending.
+        '''
+        return self._scheduler is not None
+
+    def cancel(self):
+        '''
+            Cancel the timer in O(1) time.
+            Return False if the timer had already
+            fired or been cancelled, True otherwise.
+        '''
+        if self._scheduler is None:
+            return False
+        self._scheduler._cancel(self)
+        return True
+
+
+class TimerWheelScheduler(object):
+    '''
+        Deadline scheduler based on a hierarchical
+        timer wheel, with a HeapPriorityQ holding
+        the far-future timers.
+        - Time is split into ticks of length resolution.
+        - Level l of the wheel has 2**slot_bits slots,
+          each spanning 2**(slot_bits*l) ticks. A timer
+          is stored at the lowest level whose current
+          frame contains its tick, and moves down one or
+          more levels when the clock enters its slot.
+        - Timers beyond the top level frame are kept in
+          the overflow heap, keyed by deadline, and moved
+          to the wheel when the clock reaches their frame.
+        Scheduling and cancelling take O(1) time (cancelled
+        overflow entries are dropped lazily, and the heap is
+        rebuilt in O(n) when they make up half of it), and
+        pop_due() costs O(k) for k expired timers, plus
+        the cascading of timers into lower levels.
+    '''
+    #---------- Constructor ----------
+    def __init__(self, resolution=1.0, slot_bits=6, levels=4, start=0):
+        '''
+            Constructor for the scheduler.
+            resolution is the length of a tick, slot_bits
+            the log2 of the number of slots per level, and
+            levels the number of levels of the wheel.
+            start is the current time.
+            Raises ValueError for non-positive parameters.
+        '''
+        if resolution<=0 or slot_bits<1 or levels<1:
+            raise ValueError("resolution, slot_bits and levels must be positive")
+        self._resolution = resolution
+        self._bits = slot_bits
+        self._mask = (1<<slot_bits)-1
+        self._levels = levels
+        self._cur = self._to_tick(start)
+        self._wheels = [[{} for _ in range(1<<slot_bits)] for _ in range(levels)]
+        self._counts = [0]*levels
+        # Timers whose tick has been reached, but not yet popped
+        self._ready = {}
+        self._overflow = HeapPriorityQ()
+        self._overflow_dead = 0
+        self._live = 0
+
+    #---------- Private methods ----------
+    def _to_tick(self, t):
+        '''
+            Return index of the tick containing time t.
+        '''
+        return floor(t/self._resolution)
+
+    def _place(self, h):
+        '''
+            Store handle h in the ready set, in a
+            wheel slot, or in the overflow heap,
+            depending on its tick.
+        '''
+        t, cur = h._tick, self._cur
+        if t<=cur:
+            h._slot, h._level = self._ready, -1
+        else:
+            # Lowest level whose current frame contains t
+            level = ((t^cur).bit_length()-1)//self._bits
+            if level>=self._levels:
+                h._slot, h._level = None, None
+                self._overflow.add(h._deadline, h)
+                return
+            h._slot = self._wheels[level][(t>>(self._bits*level))&self._mask]
+            h._level = level
+            self._counts[level] += 1
+        h._slot[h] = None
+
+    def _cancel(self, h):
+        '''
+            Remove handle h from the scheduler.
+        '''
+        if h._slot is not None:
+            del h._slot[h]
+            if h._level>=0:
+                self._counts[h._level] -= 1
+        else:
+            # Overflow entries are dropped lazily
+            self._overflow_dead += 1
+            if self._overflow_dead>len(self._overflow)//2:
+                self._compact_overflow()
+        h._scheduler = None
+        h._slot = None
+        self._live -= 1
+
+    def _compact_overflow(self):
+        '''
+            Rebuild the overflow heap from its
+            live entries, in O(n) time.
+        '''
+        live = [(item._key, item._value) for item in self._overflow._data
+                if item._value._scheduler is not None]
+        self._overflow = HeapPriorityQ(live)
+        self._overflow_dead = 0
+
+    def _overflow_min_tick(self):
+        '''
+            Return tick of the earliest live timer
+            of the overflow heap (None if there is none).
+        '''
+        while not self._overflow.is_empty():
+            _, h = self._overflow.min()
+            if h._scheduler is not None:
+                return h._tick
+            self._overflow.remove_min()
+            self._overflow_dead -= 1
+        return None
+
+    def _cascade(self):
+        '''
+            Redistribute the timers of the slots
+            entered by the clock at the current tick.
+        '''
+        cur, bits = self._cur, self._bits
+        top_shift = bits*self._levels
+
+        # Pull overflow timers in the new top level frame
+        if cur&((1<<top_shift)-1) == 0:
+            while True:
+                t = self._overflow_min_tick()
+                if t is None or (t>>top_shift) != (cur>>top_shift):
+                    break
+                _, h = self._overflow.remove_min()
+                self._place(h)
+
+        # Move timers of entered slots to lower levels
+        for level in range(self._levels-1, 0, -1):
+            if cur&((1<<(bits*level))-1) == 0:
+                idx = (cur>>(bits*level))&self._mask
+                slot = self._wheels[level][idx]
+                if len(slot)>0:
+                    self._wheels[level][idx] = {}
+                    self._counts[level] -= len(slot)
+                    for h in slot:
+                        self._place(h)
+
+        # Timers of the current level 0 slot are now ready
+        idx = cur&self._mask
+        slot = self._wheels[0][idx]
+        if len(slot)>0:
+            self._wheels[0][idx] = {}
+            self._counts[0] -= len(slot)
+            for h in slot:
+                h._slot, h._level = self._ready, -1
+                self._ready[h] = None
+
+    def _advance(self, target):
+        '''
+            Move the clock forward to tick target,
+            skipping ranges of ticks where no
+            timer can move.
+        '''
+        bits = self._bits
+        while self._cur<target:
+            cur = self._cur
+            level = next((l for l in range(self._levels) if self._counts[l]>0), None)
+            if level is None:
+                t = self._overflow_min_tick()
+                if t is None:
+                    self._cur = target
+                    return
+                # Start of the top level frame containing t
+                top_shift = bits*self._levels
+                step_to = (t>>top_shift)<<top_shift
+            else:
+                # Next boundary of a slot of the lowest non-empty level
+                step_to = ((cur>>(bits*level))+1)<<(bits*level)
+            self._cur = max(cur+1, min(step_to, target))
+            self._cascade()
+
+    #---------- Public methods ----------
+    def __len__(self):
+        '''
+            Return number of pending timers.
+        '''
+        return self._live
+
+    def is_empty(self):
+        '''
+            Return True if no timer is pending.
+        '''
+        return self._live == 0
+
+    def schedule(self, deadline, callback):
+        '''
+            Schedule callback at time deadline,
+            and return its TimerHandle.
+        '''
+        h = TimerHandle(deadline, self._to_tick(deadline), callback, self)
+        self._place(h)
+        self._live += 1
+        return h
+
+    def pop_due(self, now):
+        '''
+            Remove and return the list of (deadline,
+            callback) pairs of all timers with
+            deadline<=now, in increasing deadline order.
+            Callbacks are not called.
+        '''
+        target = self._to_tick(now)
+        if target>self._cur:
+            self._advance(target)
+
+        due = [h for h in self._ready if h._deadline<=now]
+        for h in due:
+            del self._ready[h]
+            h._scheduler = None
+            h._slot = None
+        self._live -= len(due)
+
+        due.sort(key=lambda h: h._deadline)
+        return [(h._deadline, h._callback) for h in due]
+
+    def run_due(self, now):
+        '''
+            Pop all timers with deadline<=now and
+            call their callbacks in deadline order.
+            Return the number of callbacks called.
+        '''
+        due = self.pop_due(now)
+        for _, callback in due:
+            callback()
+        return len(due)
@@ -0,0 +1,96 @@
+from .heap_priority_queue import HeapPriorityQ
+
+class TopKTracker(HeapPriorityQ):
+    '''
+        Bounded tracker of the k items with largest
+        keys in a stream, as an array-based min-heap
+        of at most k items.
+        The root holds the smallest of the current top
+        k keys, so an item that cannot enter the top k
+        is rejected with a single comparison.
+        Memory is O(k), accepted items cost O(log k).
+    '''
+    #---------- Constructor ----------
+    def __init__(self, k, contents=(), arity=2):
+        '''
+            Constructor for the tracker.
+            k is the capacity, and contents an optional
+            iterable of (key, value) pairs.
+            Raises ValueError if k<1.
+        '''
+        if k<1:
+            raise ValueError("Capacity of a top-k tracker must be at least 1")
+        self._capacity = k
+        super().__init__(contents, arity)
+
+    @classmethod
+    def from_pairs(cls, k, contents, arity=2):
+        '''
+            Return a new tracker of capacity k
+            keeping the top k items of an iterable
+            of (key, value) pairs.
+        '''
+        return cls(k, contents, arity)
+
+    #---------- Public methods ----------
+    def capacity(self):
+        '''
+            Return the capacity k of the tracker.
+        '''
+        return self._capacity
+
+    def pushpop(self, k, v):
+        '''
+            Offer item (k,v) to the tracker.
+            - If the tracker is not full, add the item
+              and return None.
+            - If k is not larger than the smallest key
+              kept, return (k,v) without modifying the heap.
+            - Otherwise, replace the smallest item by (k,v),
+              restore the heap-order, and return the
+              evicted (key, value) pair.
+        '''
+        data = self._data
+        if len(data)<self._capacity:
+            super().add(k,v)
+            return None
+
+        root = data[0]
+        if not root._key<k:
+            return (k,v)
+
+        data[0] = self._Item(k,v)
+        self._bubble_down(0)
+        return (root._key, root._value)
+
+    def add(self, k, v):
+        '''
+            Offer key-value item (k,v) to the tracker
+            (see pushpop()).
+        '''
+        self.pushpop(k,v)
+
+    def extend(self, contents):
+        '''
+            Offer all (key, value) pairs of the
+            iterable contents to the tracker.
+        '''
+        for k, v in contents:
+            self.pushpop(k,v)
+
+    def merge(self, other):
+        '''
+            Offer all items of the tracker (or priority
+            queue) other to the current tracker, e.g. to
+            combine partial results of several workers.
+            other is not modified.
+        '''
+        self.extend((item._key, item._value) for item in other._data)
+
+    def __iter__(self):
+        '''
+            Generate (key, value) pairs of a snapshot
+            of the current top-k, in decreasing key order.
+        '''
+        for item in sorted(self._data, reverse=True):
+            yield (item._key, item._value)
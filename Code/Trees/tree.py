@@ -19,7 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import collections
+from collections import deque
 
 class Tree:
     """Abstract base class representing a tree structure."""
@@ -64,6 +64,52 @@ class Tree:
         """Return the total number of elements in the tree."""
         raise NotImplementedError('must be implemented by subclass')
 
+    # ---------- node-level hooks for internal traversals ----------
+    # Internal consumers such as depth() and height() walk "nodes" through
+    # these hooks, without creating a Position at each step. By default a
+    # node is simply a Position; concrete trees may override the three hooks
+    # to walk their own node objects (or slot indices) instead.
+    def _to_node(self, p):
+        """Return the node at Position p (the Position itself by default)."""
+        return p
+
+    def _node_parent(self, node):
+        """Return the parent node of node (or None if node is the root)."""
+        return self.parent(node)
+
+    def _node_children(self, node):
+        """Return an iterable of the children nodes of node."""
+        return self.children(node)
+
+    # ---------- iterative traversal engines ----------
+    @staticmethod
+    def _iter_preorder(start, children):
+        """Generate start and its descendants in preorder, where children(x) gives the children of x.
+
+        An explicit stack replaces recursion, so each yield costs O(1) amortized time
+        and the depth of the tree is only limited by memory.
+        """
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            yield x
+            kids = list(children(x))
+            kids.reverse()                                # leftmost child is popped first
+            stack.extend(kids)
+
+    @staticmethod
+    def _iter_postorder(start, children):
+        """Generate start and its descendants in postorder, where children(x) gives the children of x."""
+        stack = [(start, iter(children(start)))]          # (node, iterator over its unvisited children)
+        while stack:
+            x, kids = stack[-1]
+            for c in kids:
+                stack.append((c, iter(children(c))))        # descend into next unvisited child
+                break
+            else:
+                stack.pop()                                 # all children visited
+                yield x
+
     # ---------- concrete methods implemented in this class ----------
     def is_root(self, p):
         """Return True if Position p represents the root of the tree."""
@@ -79,10 +125,12 @@ class Tree:
 
     def depth(self, p):
         """Return the number of levels separating Position p from the root."""
-        if self.is_root(p):
-            return 0
-        else:
-            return 1 + self.depth(self.parent(p))
+        d = 0
+        node = self._node_parent(self._to_node(p))
+        while node is not None:                           # walk up to the root, one level at a time
+            d += 1
+            node = self._node_parent(node)
+        return d
 
     def _height1(self):                 # works, but O(n^2) worst-case time
         """Return the height of the tree."""
@@ -90,10 +138,12 @@ class Tree:
 
     def _height2(self, p):                  # time is linear in size of subtree
         """Return the height of the subtree rooted at Position p."""
-        if self.is_leaf(p):
-            return 0
-        else:
-            return 1 + max(self._height2(c) for c in self.children(p))
+        h = 0
+        level = list(self._node_children(self._to_node(p)))
+        while level:                                      # count levels below p, one level at a time
+            h += 1
+            level = [c for node in level for c in self._node_children(node)]
+        return h
 
     def height(self, p=None):
         """Return the height of the subtree rooted at Position p.
@@ -102,7 +152,7 @@ class Tree:
         """
         if p is None:
             p = self.root()
-        return self._height2(p)        # start _height2 recursion
+        return self._height2(p)        # level-by-level count, no recursion
 
     def __iter__(self):
         """Generate an iteration of the tree's elements."""
@@ -116,36 +166,60 @@ class Tree:
     def preorder(self):
         """Generate a preorder iteration of positions in the tree."""
         if not self.is_empty():
-            for p in self._subtree_preorder(self.root()):  # start recursion
+            for p in self._subtree_preorder(self.root()):  # iterative engine
                 yield p
 
     def _subtree_preorder(self, p):
         """Generate a preorder iteration of positions in subtree rooted at p."""
-        yield p                                           # visit p before its subtrees
-        for c in self.children(p):                        # for each child c
-            for other in self._subtree_preorder(c):         # do preorder of c's subtree
-                yield other                                   # yielding each to our caller
+        return self._iter_preorder(p, self.children)      # iterative, no nested generators
 
     def postorder(self):
         """Generate a postorder iteration of positions in the tree."""
         if not self.is_empty():
-            for p in self._subtree_postorder(self.root()):  # start recursion
+            for p in self._subtree_postorder(self.root()):  # iterative engine
                 yield p
 
     def _subtree_postorder(self, p):
         """Generate a postorder iteration of positions in subtree rooted at p."""
-        for c in self.children(p):                        # for each child c
-            for other in self._subtree_postorder(c):        # do postorder of c's subtree
-                yield other                                   # yielding each to our caller
-        yield p                                           # visit p after its subtrees
+        return self._iter_postorder(p, self.children)     # iterative, no nested generators
+
+    def _bfs_start(self, p):
+        """Return the start Position of a breadth-first traversal (root if p is None)."""
+        if p is None:
+            return self.root()
+        self._to_node(p)                                   # raise an error if p is invalid
+        return p
 
-    def breadthfirst(self):
-        """Generate a breadth-first iteration of the positions of the tree."""
+    def breadthfirst(self, p=None, max_depth=None):
+        """Generate a breadth-first iteration of the positions of the tree.
+
+        If p is given, only traverse the subtree rooted at Position p.
+        If max_depth is given, only report positions at most max_depth levels below the start.
+        """
+        if not self.is_empty():
+            fringe = deque([self._bfs_start(p)])             # known positions not yet yielded
+            depth = 0                                        # depth of positions at front of fringe
+            while fringe:
+                expand = max_depth is None or depth < max_depth
+                for _ in range(len(fringe)):                 # remove one whole level from the front
+                    q = fringe.popleft()
+                    yield q                                  # report this position
+                    if expand:
+                        fringe.extend(self.children(q))        # add children to back of queue
+                depth += 1
+
+    def breadthfirst_levels(self, p=None, max_depth=None):
+        """Generate the levels of the tree as lists of positions, from top to bottom.
+
+        If p is given, only traverse the subtree rooted at Position p (which forms level 0).
+        If max_depth is given, stop after the level max_depth levels below the start.
+        """
         if not self.is_empty():
-            fringe = LinkedQueue()             # known positions not yet yielded
-            fringe.enqueue(self.root())        # starting with the root
-            while not fringe.is_empty():
-                p = fringe.dequeue()             # remove from front of the queue
-                yield p                          # report this position
-                for c in self.children(p):
-                    fringe.enqueue(c)              # add children to back of queue
\ No newline at end of file
+            level = [self._bfs_start(p)]
+            depth = 0
+            while level:
+                yield level
+                if max_depth is not None and depth >= max_depth:
+                    return
+                level = [c for q in level for c in self.children(q)]  # next level, left to right
+                depth += 1